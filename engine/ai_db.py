@@ -6,9 +6,14 @@ The local DB is a derived cache. Canonical state lives in .ai/state/*.yaml.
 
 from __future__ import annotations
 
-import json
 import sqlite3
+import threading
+import weakref
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Iterable, Iterator
+
+from . import json_codec
 
 SCHEMA_SQL = """
 CREATE TABLE IF NOT EXISTS events (
@@ -52,41 +57,172 @@ CREATE TABLE IF NOT EXISTS snapshots (
     key TEXT PRIMARY KEY,
     value TEXT
 );
+
+CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status);
+CREATE INDEX IF NOT EXISTS idx_approvals_pending ON approvals(status) WHERE status = 'pending';
 """
 
 
+# Per-connection tuning. journal_mode=WAL is persistent in the DB file, so it
+# is set by _ensure_wal when a connection is first opened, not per call.
+CONNECTION_PRAGMAS = (
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "cache_size=-20000",
+    "mmap_size=268435456",
+    "foreign_keys=ON",
+)
+
+# sqlite3 keeps an LRU of compiled statements per connection; size it so every
+# statement in this module stays prepared for the life of the connection.
+CACHED_STATEMENTS = 256
+
+# Hot statements, shared by every call site so they hit the statement cache.
+SQL_INSERT_WORKER = (
+    "INSERT OR REPLACE INTO workers (id, role_id, title, department, provider, model, reports_to, authority) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+SQL_INSERT_TASK = (
+    "INSERT OR REPLACE INTO tasks (id, title, status, owner_role, requires_approval_json, updated_ts) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+SQL_INSERT_APPROVAL = (
+    "INSERT INTO approvals (task_id, approval_type, status, approved_by, ts) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+SQL_INSERT_EVENT = "INSERT INTO events (ts, actor, type, payload_json) VALUES (?, ?, ?, ?)"
+SQL_SELECT_EVENTS = "SELECT ts, actor, type, payload_json FROM events ORDER BY id"
+SQL_SET_SNAPSHOT = "INSERT OR REPLACE INTO snapshots (key, value) VALUES (?, ?)"
+SQL_GET_SNAPSHOT = "SELECT value FROM snapshots WHERE key = ?"
+
+# One open connection per (DB path, thread). The per-thread dicts live in a
+# threading.local, so a thread's connections are released when it exits;
+# _OPEN_CONNS tracks every live connection per path so close_db can reach
+# all of them. See connect_db / release_db / close_db.
+_LOCAL = threading.local()
+_OPEN_CONNS: dict[str, weakref.WeakSet] = {}
+_OPEN_CONNS_LOCK = threading.Lock()
+
+
+class _CachedConnection(sqlite3.Connection):
+    """Connection shared through the per-thread cache.
+
+    close() really closes and evicts it; callers that want to keep it warm
+    hand it back with release_db instead.
+    """
+
+    _key = ""
+    _closed = False
+
+    def close(self):
+        self._closed = True
+        cache = _thread_conns()
+        if cache.get(self._key) is self:
+            del cache[self._key]
+        super().close()
+
+
 def get_db_path(runtime_dir: Path) -> Path:
     return runtime_dir / "ai.db"
 
 
+def _cache_key(db_path: Path) -> str:
+    return str(db_path.absolute())
+
+
+def _thread_conns() -> dict[str, _CachedConnection]:
+    conns = getattr(_LOCAL, "conns", None)
+    if conns is None:
+        conns = _LOCAL.conns = {}
+    return conns
+
+
+def _apply_pragmas(conn: sqlite3.Connection):
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(f"PRAGMA {pragma}")
+
+
+def _ensure_wal(conn: sqlite3.Connection):
+    """Switch the DB file to WAL unless it already is (the mode persists)."""
+    if conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal":
+        return
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+    except sqlite3.OperationalError:
+        pass  # Locked by another process; retried on the next fresh open
+
+
+def _open(db_path: Path) -> _CachedConnection:
+    # check_same_thread=False only so close_db can close another thread's
+    # connection; each one is otherwise used by the thread that opened it.
+    conn = sqlite3.connect(
+        str(db_path),
+        factory=_CachedConnection,
+        cached_statements=CACHED_STATEMENTS,
+        check_same_thread=False,
+    )
+    conn.row_factory = sqlite3.Row
+    conn._key = key = _cache_key(db_path)
+    _thread_conns()[key] = conn
+    with _OPEN_CONNS_LOCK:
+        _OPEN_CONNS.setdefault(key, weakref.WeakSet()).add(conn)
+    return conn
+
+
+def release_db(conn: sqlite3.Connection):
+    """Hand a connect_db connection back, discarding uncommitted work.
+
+    The connection stays open in the per-thread cache for the next call.
+    """
+    if conn.in_transaction:
+        conn.rollback()
+
+
+def close_db(runtime_dir: Path):
+    """Close every cached connection to runtime_dir's DB, in all threads."""
+    key = _cache_key(get_db_path(runtime_dir))
+    with _OPEN_CONNS_LOCK:
+        conns = list(_OPEN_CONNS.pop(key, ()))
+    for conn in conns:
+        conn.close()
+
+
 def create_db(runtime_dir: Path) -> sqlite3.Connection:
     """Create the SQLite database and schema."""
     db_path = get_db_path(runtime_dir)
     db_path.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(db_path))
-    conn.row_factory = sqlite3.Row
+    close_db(runtime_dir)
+    conn = _open(db_path)
+    _ensure_wal(conn)
+    _apply_pragmas(conn)
     conn.executescript(SCHEMA_SQL)
     conn.commit()
     return conn
 
 
 def connect_db(runtime_dir: Path) -> sqlite3.Connection:
-    """Connect to an existing DB, or create if missing."""
+    """Return this thread's cached connection to the DB, creating the DB if missing.
+
+    Hand it back with release_db when done; close() really closes it.
+    """
     db_path = get_db_path(runtime_dir)
     if not db_path.exists():
         return create_db(runtime_dir)
-    conn = sqlite3.connect(str(db_path))
-    conn.row_factory = sqlite3.Row
+    conn = _thread_conns().get(_cache_key(db_path))
+    if conn is None or conn._closed:
+        conn = _open(db_path)
+        # DBs created by older versions may still use the rollback journal
+        _ensure_wal(conn)
+        _apply_pragmas(conn)
+        # Idempotent; brings DBs created by older versions up to date (indexes).
+        conn.executescript(SCHEMA_SQL)
     return conn
 
 
 def ingest_team(conn: sqlite3.Connection, team_data: dict):
     """Ingest team.yaml data into the workers table."""
-    conn.execute("DELETE FROM workers")
     orch = team_data.get("orchestrator", {})
-    conn.execute(
-        "INSERT OR REPLACE INTO workers (id, role_id, title, department, provider, model, reports_to, authority) "
-        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+    rows: list[tuple] = [
         (
             orch.get("role_id", "orchestrator"),
             orch.get("role_id", "orchestrator"),
@@ -96,143 +232,159 @@ def ingest_team(conn: sqlite3.Connection, team_data: dict):
             None,
             None,
             orch.get("authority", "write"),
-        ),
-    )
+        )
+    ]
     for role in team_data.get("roles", []):
         for worker in role.get("workers", []):
-            conn.execute(
-                "INSERT OR REPLACE INTO workers (id, role_id, title, department, provider, model, reports_to, authority) "
-                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
-                (
-                    worker.get("id", role["role_id"]),
-                    role["role_id"],
-                    role.get("title", ""),
-                    role.get("department", ""),
-                    worker.get("provider", ""),
-                    worker.get("model", ""),
-                    role.get("reports_to", ""),
-                    role.get("authority", "read"),
-                ),
-            )
+            rows.append((
+                worker.get("id", role["role_id"]),
+                role["role_id"],
+                role.get("title", ""),
+                role.get("department", ""),
+                worker.get("provider", ""),
+                worker.get("model", ""),
+                role.get("reports_to", ""),
+                role.get("authority", "read"),
+            ))
         if not role.get("workers"):
-            conn.execute(
-                "INSERT OR REPLACE INTO workers (id, role_id, title, department, provider, model, reports_to, authority) "
-                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
-                (
-                    role["role_id"],
-                    role["role_id"],
-                    role.get("title", ""),
-                    role.get("department", ""),
-                    None,
-                    None,
-                    role.get("reports_to", ""),
-                    role.get("authority", "read"),
-                ),
-            )
-    conn.commit()
+            rows.append((
+                role["role_id"],
+                role["role_id"],
+                role.get("title", ""),
+                role.get("department", ""),
+                None,
+                None,
+                role.get("reports_to", ""),
+                role.get("authority", "read"),
+            ))
+    with conn:
+        conn.execute("DELETE FROM workers")
+        conn.executemany(SQL_INSERT_WORKER, rows)
 
 
 def ingest_board(conn: sqlite3.Connection, board_data: dict):
     """Ingest board.yaml data into the tasks table."""
-    conn.execute("DELETE FROM tasks")
-    from datetime import datetime, timezone
-
     now = datetime.now(timezone.utc).isoformat()
-    for task in board_data.get("tasks", []):
-        approvals = task.get("requires_approval", [])
-        conn.execute(
-            "INSERT OR REPLACE INTO tasks (id, title, status, owner_role, requires_approval_json, updated_ts) "
-            "VALUES (?, ?, ?, ?, ?, ?)",
-            (
-                task["id"],
-                task["title"],
-                task["status"],
-                task.get("owner_role", ""),
-                json.dumps(approvals),
-                now,
-            ),
+    rows = [
+        (
+            task["id"],
+            task["title"],
+            task["status"],
+            task.get("owner_role", ""),
+            json_codec.dumps(task.get("requires_approval", [])),
+            now,
         )
-    conn.commit()
+        for task in board_data.get("tasks", [])
+    ]
+    with conn:
+        conn.execute("DELETE FROM tasks")
+        conn.executemany(SQL_INSERT_TASK, rows)
 
 
 def ingest_approvals(conn: sqlite3.Connection, approvals_data: dict):
     """Ingest approvals.yaml approval_log into the approvals table."""
-    conn.execute("DELETE FROM approvals")
-    for entry in approvals_data.get("approval_log", []):
-        conn.execute(
-            "INSERT INTO approvals (task_id, approval_type, status, approved_by, ts) "
-            "VALUES (?, ?, ?, ?, ?)",
-            (
-                entry.get("task_id", ""),
-                entry.get("approval_type", entry.get("trigger_id", "")),
-                entry.get("status", "pending"),
-                entry.get("approved_by", ""),
-                entry.get("timestamp", ""),
-            ),
+    rows = [
+        (
+            entry.get("task_id", ""),
+            entry.get("approval_type", entry.get("trigger_id", "")),
+            entry.get("status", "pending"),
+            entry.get("approved_by", ""),
+            entry.get("timestamp", ""),
         )
-    conn.commit()
+        for entry in approvals_data.get("approval_log", [])
+    ]
+    with conn:
+        conn.execute("DELETE FROM approvals")
+        conn.executemany(SQL_INSERT_APPROVAL, rows)
 
 
 def set_snapshot(conn: sqlite3.Connection, key: str, value: str):
-    conn.execute(
-        "INSERT OR REPLACE INTO snapshots (key, value) VALUES (?, ?)", (key, value)
-    )
+    conn.execute(SQL_SET_SNAPSHOT, (key, value))
     conn.commit()
 
 
 def get_snapshot(conn: sqlite3.Connection, key: str) -> str | None:
-    row = conn.execute(
-        "SELECT value FROM snapshots WHERE key = ?", (key,)
-    ).fetchone()
+    row = conn.execute(SQL_GET_SNAPSHOT, (key,)).fetchone()
     return row["value"] if row else None
 
 
 def add_event(conn: sqlite3.Connection, actor: str, event_type: str, payload: dict | None = None):
-    from datetime import datetime, timezone
-
     conn.execute(
-        "INSERT INTO events (ts, actor, type, payload_json) VALUES (?, ?, ?, ?)",
+        SQL_INSERT_EVENT,
         (
             datetime.now(timezone.utc).isoformat(),
             actor,
             event_type,
-            json.dumps(payload) if payload else None,
+            json_codec.dumps(payload) if payload else None,
         ),
     )
     conn.commit()
 
 
+def _tuple_cursor(conn: sqlite3.Connection) -> sqlite3.Cursor:
+    """Cursor that yields plain tuples (skips sqlite3.Row construction)."""
+    cur = conn.cursor()
+    cur.row_factory = None
+    return cur
+
+
+def iter_events(conn: sqlite3.Connection, batch_size: int = 1000) -> Iterator[dict]:
+    """Yield events in insertion order, fetching batch_size rows at a time."""
+    cur = _tuple_cursor(conn).execute(SQL_SELECT_EVENTS)
+    loads = json_codec.loads
+    while True:
+        rows = cur.fetchmany(batch_size)
+        if not rows:
+            break
+        for ts, actor, event_type, payload_json in rows:
+            entry = {"ts": ts, "actor": actor, "type": event_type}
+            if payload_json:
+                entry["payload"] = loads(payload_json)
+            yield entry
+
+
 def export_events(conn: sqlite3.Connection) -> list[dict]:
-    rows = conn.execute("SELECT ts, actor, type, payload_json FROM events ORDER BY id").fetchall()
-    result = []
-    for r in rows:
-        entry = {"ts": r["ts"], "actor": r["actor"], "type": r["type"]}
-        if r["payload_json"]:
-            entry["payload"] = json.loads(r["payload_json"])
-        result.append(entry)
-    return result
+    return list(iter_events(conn))
+
+
+def _fetch_dicts(conn: sqlite3.Connection, sql: str) -> list[dict]:
+    cur = _tuple_cursor(conn).execute(sql)
+    cols = [d[0] for d in cur.description]
+    return [dict(zip(cols, row)) for row in cur]
 
 
 def export_derived(conn: sqlite3.Connection) -> dict:
-    workers = [dict(r) for r in conn.execute("SELECT * FROM workers").fetchall()]
-    tasks = [dict(r) for r in conn.execute("SELECT * FROM tasks").fetchall()]
-    approvals = [dict(r) for r in conn.execute("SELECT * FROM approvals").fetchall()]
+    workers = _fetch_dicts(
+        conn,
+        "SELECT id, role_id, title, department, provider, model, reports_to, authority FROM workers",
+    )
+    tasks = _fetch_dicts(
+        conn,
+        "SELECT id, title, status, owner_role, requires_approval_json, updated_ts FROM tasks",
+    )
+    approvals = _fetch_dicts(
+        conn,
+        "SELECT id, task_id, approval_type, status, approved_by, ts FROM approvals",
+    )
     return {"workers": workers, "tasks": tasks, "approvals": approvals}
 
 
-def import_events(conn: sqlite3.Connection, events: list[dict]):
-    for ev in events:
-        payload = ev.get("payload")
-        conn.execute(
-            "INSERT INTO events (ts, actor, type, payload_json) VALUES (?, ?, ?, ?)",
+def import_events(conn: sqlite3.Connection, events: Iterable[dict]) -> int:
+    """Insert events in one transaction. Returns the number of rows inserted."""
+    with conn:
+        cur = conn.executemany(
+            SQL_INSERT_EVENT,
             (
-                ev["ts"],
-                ev["actor"],
-                ev["type"],
-                json.dumps(payload) if payload else None,
+                (
+                    ev["ts"],
+                    ev["actor"],
+                    ev["type"],
+                    json_codec.dumps(ev["payload"]) if ev.get("payload") else None,
+                )
+                for ev in events
             ),
         )
-    conn.commit()
+    return max(cur.rowcount, 0)
 
 
 def get_task_counts(conn: sqlite3.Connection) -> dict[str, int]:
@@ -19,6 +19,12 @@ WHITELISTED_PATHS = [
     ".ai/workers/",
 ]
 
+# Local caches that live under whitelisted dirs but are never committed.
+IGNORED_PATHS = [
+    ".ai/state/.canonical.json",
+    ".ai/state/.dirty",
+]
+
 
 def run_git(args: list[str], cwd: Path) -> subprocess.CompletedProcess:
     return subprocess.run(
@@ -99,7 +105,10 @@ def git_sync(project_root: Path, message: str | None = None) -> tuple[bool, str]
     # Verify only whitelisted files are staged — unstage anything else
     # including anything inside submodules
     for line in staged_files.splitlines():
-        allowed = any(line.startswith(wp.rstrip("/")) for wp in WHITELISTED_PATHS)
+        allowed = (
+            any(line.startswith(wp.rstrip("/")) for wp in WHITELISTED_PATHS)
+            and line not in IGNORED_PATHS
+        )
         in_submodule = any(line.startswith(sp) for sp in submodule_paths)
         if not allowed or in_submodule:
             run_git(["reset", "HEAD", line], cwd=project_root)
@@ -113,8 +122,12 @@ def git_sync(project_root: Path, message: str | None = None) -> tuple[bool, str]
         return False, f"Commit failed: {result.stderr.strip()}"
 
 
-def ensure_gitignore(project_root: Path, entry: str = ".ai_runtime/"):
-    """Ensure .ai_runtime/ is in the project .gitignore."""
+def ensure_gitignore(
+    project_root: Path,
+    entry: str = ".ai_runtime/",
+    comment: str = "AI runtime (local cache, never committed)",
+):
+    """Ensure entry (default .ai_runtime/) is in the project .gitignore."""
     gitignore = project_root / ".gitignore"
     if gitignore.exists():
         content = gitignore.read_text()
@@ -122,8 +135,6 @@ def ensure_gitignore(project_root: Path, entry: str = ".ai_runtime/"):
             with open(gitignore, "a") as f:
                 if not content.endswith("\n"):
                     f.write("\n")
-                f.write(f"\n# AI runtime (local cache, never committed)\n{entry}\n")
+                f.write(f"\n# {comment}\n{entry}\n")
     else:
-        gitignore.write_text(
-            f"# AI runtime (local cache, never committed)\n{entry}\n"
-        )
+        gitignore.write_text(f"# {comment}\n{entry}\n")
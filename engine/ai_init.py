@@ -11,6 +11,7 @@ import shutil
 import subprocess
 import uuid
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
 try:
@@ -56,6 +57,7 @@ def _yaml_load(text: str) -> dict:
     raise ImportError("PyYAML is required. Install it: pip install pyyaml")
 
 
+@lru_cache(maxsize=1)
 def find_skeleton_dir() -> Path:
     """Find the skeleton repo directory (where this engine lives)."""
     return Path(__file__).resolve().parent.parent
@@ -537,6 +539,8 @@ def init(
 
     # 4) Ensure .gitignore has .ai_runtime/
     ai_git.ensure_gitignore(project_root)
+    for entry in ai_git.IGNORED_PATHS:
+        ai_git.ensure_gitignore(project_root, entry, "AI state local cache files (never committed)")
     print("  [OK] .gitignore updated")
 
     # 5) Ingest canonical state into SQLite
@@ -550,7 +554,7 @@ def init(
         "project_root": str(project_root),
         "skeleton_version": meta["skeleton_version"],
     })
-    conn.close()
+    ai_db.release_db(conn)
 
     # 7) Run onboarding if team is default
     if interactive:
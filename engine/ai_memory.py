@@ -7,14 +7,118 @@ Canonical state remains in .ai/state/*.yaml (repo source of truth).
 
 from __future__ import annotations
 
-import json
+import io
 import os
 import shutil
+import tarfile
+import tempfile
 import zipfile
+from contextlib import ExitStack
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import BinaryIO, Callable, Iterable, Iterator
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+from . import ai_db, ai_state, json_codec
+
+# Pack format versions this module can read. 1.1 packs may store events
+# as length-prefixed MessagePack frames (events.msgpack) instead of JSONL;
+# the manifest's events_format says which.
+SUPPORTED_PACK_VERSIONS = ("1.0", "1.1")
+_FRAME_HEADER_SIZE = 4
+EVENTS_MEMBERS = {"jsonl": "events.jsonl", "msgpack": "events.msgpack"}
+_PACK_MEMBERS = frozenset(
+    {"manifest.json", "derived_state.json", *EVENTS_MEMBERS.values()}
+)
+# Events held in memory before a .tar.zst export spills them to a temp file.
+_SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
+
+def _write_events(f, events: Iterable[dict], events_format: str):
+    """Write events to a binary stream in events_format.
+
+    msgpack: 4-byte big-endian length prefix + frame per event.
+    jsonl: one JSON object per line.
+    """
+    if events_format == "msgpack":
+        enc = msgspec.msgpack.Encoder()
+        for ev in events:
+            frame = enc.encode(ev)
+            f.write(len(frame).to_bytes(_FRAME_HEADER_SIZE, "big"))
+            f.write(frame)
+    else:
+        for ev in events:
+            f.write(json_codec.dumps_line(ev))
+
+
+def _iter_events_msgpack(f: BinaryIO) -> Iterator[dict]:
+    """Yield events written by _write_events in msgpack format."""
+    dec = msgspec.msgpack.Decoder()
+    with f:
+        while True:
+            header = f.read(_FRAME_HEADER_SIZE)
+            if not header:
+                break
+            yield dec.decode(f.read(int.from_bytes(header, "big")))
+
+
+def _iter_events_jsonl(f: BinaryIO) -> Iterator[dict]:
+    """Yield events from a JSONL stream, skipping blank lines."""
+    with f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json_codec.loads(line)
+
+
+def _open_pack(
+    in_p: Path, stack: ExitStack
+) -> tuple[set[str], Callable[[str], BinaryIO]]:
+    """Return (member names, opener) for a pack directory, .zip or .tar.zst.
 
-from . import ai_db, ai_state
+    Zip members are streamed from the archive; .tar.zst members are
+    extracted to a temp directory that lives as long as the stack.
+    Raises ValueError if in_p is not a readable pack.
+    """
+    if in_p.suffix == ".zip" and in_p.is_file():
+        zf = stack.enter_context(zipfile.ZipFile(str(in_p), "r"))
+        return set(zf.namelist()), zf.open
+    if in_p.name.endswith(".tar.zst") and in_p.is_file():
+        if zstandard is None:
+            raise ValueError("zstandard is required for .tar.zst packs. Install it: pip install zstandard")
+        # tar members can only be read sequentially, so stream them once
+        # into a temp directory (removed with the stack) and read from there.
+        tmp_dir = Path(stack.enter_context(tempfile.TemporaryDirectory()))
+        names: set[str] = set()
+        with open(in_p, "rb") as fp:
+            with zstandard.ZstdDecompressor().stream_reader(fp) as zr:
+                with tarfile.open(fileobj=zr, mode="r|") as tf:
+                    for member in tf:
+                        # Only known flat member names reach the filesystem
+                        if not member.isfile() or member.name not in _PACK_MEMBERS:
+                            continue
+                        with open(tmp_dir / member.name, "wb") as out:
+                            shutil.copyfileobj(tf.extractfile(member), out)
+                        names.add(member.name)
+        return names, lambda name: open(tmp_dir / name, "rb")
+    if in_p.is_dir():
+        names = {p.name for p in in_p.iterdir() if p.is_file()}
+        return names, lambda name: open(in_p / name, "rb")
+    raise ValueError(f"{in_p} is not a valid memory pack directory or zip file.")
 
 
 def export_memory(
@@ -22,14 +126,25 @@ def export_memory(
     runtime_dir: Path,
     skeleton_version: str,
     out_path: str | None = None,
+    compress: int = zipfile.ZIP_DEFLATED,
+    events_format: str = "jsonl",
 ) -> str:
     """Export a memory pack.
 
-    Returns the path to the created pack (directory or zip).
+    out_path ending in .zip streams the pack straight into the archive
+    (compression chosen by `compress`, e.g. zipfile.ZIP_STORED); .tar.zst
+    streams a tar through zstandard. Anything else is a directory.
+
+    Events are JSONL unless events_format="msgpack" (requires msgspec, and
+    msgspec on the importing machine too). msgpack is API-only: the CLI's
+    export-memory always writes JSONL.
+
+    Returns the path to the created pack (directory or archive).
     """
-    ts = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S_%f")
-    pack_dir = runtime_dir / "memory_pack_cache" / f"memory_pack_{ts}"
-    pack_dir.mkdir(parents=True, exist_ok=True)
+    if events_format not in EVENTS_MEMBERS:
+        raise ValueError(f"Unknown events format: {events_format}")
+    if events_format == "msgpack" and msgspec is None:
+        raise ImportError("msgspec is required for msgpack events. Install it: pip install msgspec")
 
     conn = ai_db.connect_db(runtime_dir)
 
@@ -41,7 +156,6 @@ def export_memory(
     project_id = "unknown"
     if metadata_path.exists():
         try:
-            import yaml
             meta = yaml.safe_load(metadata_path.read_text()) or {}
             project_id = meta.get("project_id", "unknown")
         except Exception:
@@ -49,52 +163,105 @@ def export_memory(
 
     # Check if canonical worker state exists
     workers_dir = ai_dir / "workers"
-    worker_state_included = workers_dir.is_dir() and any(workers_dir.rglob("*"))
+    try:
+        worker_state_included = next(workers_dir.iterdir(), None) is not None
+    except OSError:
+        worker_state_included = False
 
-    # Write manifest
     manifest = {
-        "version": "1.0",
+        "version": "1.1" if events_format == "msgpack" else "1.0",
+        "events_format": events_format,
         "project_id": project_id,
         "created_at": datetime.now(timezone.utc).isoformat(),
         "skeleton_version": skeleton_version,
         "canonical_hash": canonical_hash,
         "worker_state_included": worker_state_included,
     }
-    (pack_dir / "manifest.json").write_text(json.dumps(manifest, indent=2))
+    manifest_text = json_codec.dumps(manifest, indent=True)
+    derived_text = json_codec.dumps(ai_db.export_derived(conn), indent=True)
+    out_p = Path(out_path) if out_path else None
 
-    # Write events as JSONL
-    events = ai_db.export_events(conn)
-    with open(pack_dir / "events.jsonl", "w") as f:
-        for ev in events:
-            f.write(json.dumps(ev) + "\n")
-
-    # Write derived state
-    derived = ai_db.export_derived(conn)
-    (pack_dir / "derived_state.json").write_text(json.dumps(derived, indent=2))
-
-    conn.close()
-
-    # Optionally compress
-    if out_path:
-        out_p = Path(out_path)
-        if out_p.suffix == ".zip":
-            with zipfile.ZipFile(str(out_p), "w", zipfile.ZIP_DEFLATED) as zf:
-                for fpath in pack_dir.rglob("*"):
-                    if fpath.is_file():
-                        zf.write(str(fpath), fpath.relative_to(pack_dir))
-            shutil.rmtree(str(pack_dir))
-            return str(out_p)
-        else:
-            # Copy to specified directory
-            if out_p.exists():
-                shutil.rmtree(str(out_p))
-            shutil.copytree(str(pack_dir), str(out_p))
+    # Events are streamed from the DB cursor straight into the pack.
+    try:
+        return _emit_pack(
+            runtime_dir, out_p, compress, events_format,
+            manifest_text, ai_db.iter_events(conn), derived_text,
+        )
+    finally:
+        ai_db.release_db(conn)
+
+
+def _emit_pack(
+    runtime_dir: Path,
+    out_p: Path | None,
+    compress: int,
+    events_format: str,
+    manifest_text: str,
+    events: Iterable[dict],
+    derived_text: str,
+) -> str:
+    """Write pack members to out_p (zip, tar.zst or directory)."""
+    events_name = EVENTS_MEMBERS[events_format]
+    if out_p is not None and out_p.suffix == ".zip":
+        with zipfile.ZipFile(str(out_p), "w", compress, compresslevel=1) as zf:
+            zf.writestr("manifest.json", manifest_text)
+            # Streamed, so the size is unknown up front; zip64 lifts the 2 GiB cap
+            with zf.open(events_name, "w", force_zip64=True) as f:
+                _write_events(f, events, events_format)
+            zf.writestr("derived_state.json", derived_text)
+        return str(out_p)
+
+    if out_p is not None and out_p.name.endswith(".tar.zst"):
+        if zstandard is None:
+            raise ImportError("zstandard is required for .tar.zst packs. Install it: pip install zstandard")
+        # A tar header needs the member size up front, so the events are
+        # spooled (to disk once past _SPOOL_MAX_BYTES) before being added.
+        with tempfile.SpooledTemporaryFile(_SPOOL_MAX_BYTES, dir=runtime_dir) as events_f:
+            _write_events(events_f, events, events_format)
+            with open(out_p, "wb") as fp:
+                with zstandard.ZstdCompressor().stream_writer(fp) as zw:
+                    with tarfile.open(fileobj=zw, mode="w|") as tf:
+                        _add_tar_member(tf, "manifest.json", io.BytesIO(manifest_text.encode()))
+                        _add_tar_member(tf, events_name, events_f)
+                        _add_tar_member(tf, "derived_state.json", io.BytesIO(derived_text.encode()))
+        return str(out_p)
+
+    ts = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S_%f")
+    pack_dir = runtime_dir / "memory_pack_cache" / f"memory_pack_{ts}"
+    pack_dir.mkdir(parents=True, exist_ok=True)
+    (pack_dir / "manifest.json").write_text(manifest_text)
+    with open(pack_dir / events_name, "wb") as f:
+        _write_events(f, events, events_format)
+    (pack_dir / "derived_state.json").write_text(derived_text)
+
+    if out_p is not None:
+        # Move to specified directory: rename when on the same filesystem,
+        # else hardlink the files, else fall back to a plain copy.
+        if out_p.exists():
+            shutil.rmtree(str(out_p))
+        try:
+            pack_dir.rename(out_p)
+        except OSError:
+            try:
+                shutil.copytree(str(pack_dir), str(out_p), copy_function=os.link)
+            except OSError:
+                if out_p.exists():
+                    shutil.rmtree(str(out_p))
+                shutil.copytree(str(pack_dir), str(out_p))
             shutil.rmtree(str(pack_dir))
-            return str(out_p)
+        return str(out_p)
 
     return str(pack_dir)
 
 
+def _add_tar_member(tf: tarfile.TarFile, name: str, f: BinaryIO) -> None:
+    """Add seekable stream f to tf as a regular file, from its start."""
+    info = tarfile.TarInfo(name)
+    info.size = f.seek(0, os.SEEK_END)
+    f.seek(0)
+    tf.addfile(info, f)
+
+
 def import_memory(
     ai_dir: Path,
     runtime_dir: Path,
@@ -106,60 +273,57 @@ def import_memory(
     """
     in_p = Path(in_path).resolve()
 
-    # Handle zip files
-    if in_p.suffix == ".zip" and in_p.is_file():
-        extract_dir = runtime_dir / "memory_pack_cache" / "import_tmp"
-        if extract_dir.exists():
-            shutil.rmtree(str(extract_dir))
-        extract_dir.mkdir(parents=True, exist_ok=True)
-        with zipfile.ZipFile(str(in_p), "r") as zf:
-            zf.extractall(str(extract_dir))
-        in_p = extract_dir
-
-    if not in_p.is_dir():
-        return f"Error: {in_path} is not a valid memory pack directory or zip file."
-
-    # Validate manifest
-    manifest_path = in_p / "manifest.json"
-    if not manifest_path.exists():
-        return "Error: No manifest.json found in memory pack."
-
-    manifest = json.loads(manifest_path.read_text())
-    if manifest.get("version") != "1.0":
-        return f"Error: Unsupported memory pack version: {manifest.get('version')}"
-
-    conn = ai_db.connect_db(runtime_dir)
-
-    # Import events
-    events_path = in_p / "events.jsonl"
-    imported_count = 0
-    if events_path.exists():
-        events = []
-        with open(events_path) as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    events.append(json.loads(line))
-        ai_db.import_events(conn, events)
-        imported_count = len(events)
-
-    # Import derived state if schema matches
-    derived_path = in_p / "derived_state.json"
-    derived_imported = False
-    if derived_path.exists():
+    with ExitStack() as stack:
         try:
-            derived = json.loads(derived_path.read_text())
-            # Only import derived if canonical hash matches (schema compatible)
-            current_hash = ai_state.compute_canonical_hash(ai_dir)
-            if manifest.get("canonical_hash") == current_hash:
-                # Schema matches, safe to import derived
-                derived_imported = True
-            # Events are always imported; derived only when compatible
-        except Exception:
-            pass
+            names, open_member = _open_pack(in_p, stack)
+        except ValueError as e:
+            return f"Error: {e}"
+
+        # Validate manifest
+        if "manifest.json" not in names:
+            return "Error: No manifest.json found in memory pack."
+
+        with open_member("manifest.json") as f:
+            manifest = json_codec.loads(f.read())
+        if manifest.get("version") not in SUPPORTED_PACK_VERSIONS:
+            return f"Error: Unsupported memory pack version: {manifest.get('version')}"
+
+        # Packs predating events_format carry JSONL, or msgpack when
+        # msgspec was installed on the exporting machine.
+        events_format = manifest.get("events_format") or (
+            "msgpack" if "events.msgpack" in names else "jsonl"
+        )
+        if events_format not in EVENTS_MEMBERS:
+            return f"Error: Unsupported memory pack events format: {events_format}"
+        if events_format == "msgpack" and msgspec is None:
+            return "Error: Memory pack events are msgpack-encoded. Install msgspec: pip install msgspec"
+
+        conn = ai_db.connect_db(runtime_dir)
+
+        # Import events (streamed from the pack member into one executemany)
+        imported_count = 0
+        events_name = EVENTS_MEMBERS[events_format]
+        if events_name in names:
+            read_events = _iter_events_msgpack if events_format == "msgpack" else _iter_events_jsonl
+            imported_count = ai_db.import_events(conn, read_events(open_member(events_name)))
+
+        # Import derived state if schema matches
+        current_hash = ai_state.compute_canonical_hash(ai_dir)
+        derived_imported = False
+        if "derived_state.json" in names:
+            try:
+                with open_member("derived_state.json") as f:
+                    derived = json_codec.loads(f.read())
+                # Only import derived if canonical hash matches (schema compatible)
+                if ai_state.canonical_hash_matches(ai_dir, manifest.get("canonical_hash") or ""):
+                    # Schema matches, safe to import derived
+                    derived_imported = True
+                # Events are always imported; derived only when compatible
+            except Exception:
+                pass
 
     # Run reconciliation — canonical YAML is source of truth
-    ai_state.reconcile(ai_dir, runtime_dir)
+    ai_state.reconcile(ai_dir, runtime_dir, canonical_hash=current_hash)
 
     ai_db.add_event(conn, "system", "import_memory", {
         "source": str(in_path),
@@ -167,12 +331,7 @@ def import_memory(
         "derived_imported": derived_imported,
     })
 
-    conn.close()
-
-    # Clean up temp extract
-    tmp_dir = runtime_dir / "memory_pack_cache" / "import_tmp"
-    if tmp_dir.exists():
-        shutil.rmtree(str(tmp_dir))
+    ai_db.release_db(conn)
 
     return (
         f"Imported {imported_count} events from memory pack.\n"
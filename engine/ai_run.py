@@ -8,12 +8,21 @@ and auto-export on graceful exit.
 
 from __future__ import annotations
 
+import shlex
+import sys
 import uuid
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
 from . import ai_db, ai_git, ai_init, ai_memory, ai_state, ai_validate
 from . import ai_intents, ai_scope, ai_persistence, ai_recovery
+from .memory_core.api import SessionMemory
 
 
 def _load_adapter_data(project_root: Path) -> dict | None:
@@ -35,6 +44,7 @@ def _load_adapter_data(project_root: Path) -> dict | None:
         return None
 
 
+@lru_cache(maxsize=1)
 def find_schemas_dir() -> Path:
     """Find the schemas directory in the skeleton repo."""
     return ai_init.find_skeleton_dir() / "schemas"
@@ -86,10 +96,12 @@ def handle_rehydrate_db(project_root: Path, **kwargs) -> str:
     ai_dir = project_root / ".ai"
     runtime_dir = project_root / ".ai_runtime"
 
-    # Delete existing DB and rebuild
+    # Delete existing DB (and any WAL sidecars) and rebuild
+    ai_db.close_db(runtime_dir)
     db_path = ai_db.get_db_path(runtime_dir)
-    if db_path.exists():
-        db_path.unlink()
+    for path in (db_path, db_path.with_name(db_path.name + "-wal"), db_path.with_name(db_path.name + "-shm")):
+        if path.exists():
+            path.unlink()
 
     ai_db.create_db(runtime_dir)
     updated = ai_state.reconcile(ai_dir, runtime_dir)
@@ -164,8 +176,6 @@ def handle_session_memory_export(
     **kwargs,
 ) -> str:
     """Export session memory pack."""
-    from .memory_core.api import SessionMemory
-
     mem = SessionMemory(project_root)
     try:
         ns_list = namespaces.split(",") if namespaces else None
@@ -185,8 +195,6 @@ def handle_session_memory_import(
     if not in_path:
         return "Error: --in <path> is required."
 
-    from .memory_core.api import SessionMemory
-
     mem = SessionMemory(project_root)
     try:
         counts = mem.import_pack(in_path)
@@ -205,8 +213,6 @@ def handle_session_memory_purge(
     **kwargs,
 ) -> str:
     """Purge session memory."""
-    from .memory_core.api import SessionMemory
-
     mem = SessionMemory(project_root)
     try:
         days_int = int(days) if days else None
@@ -376,10 +382,13 @@ def handle_show_checkpoints(project_root: Path, **kwargs) -> str:
     if not roster:
         return "No workers in roster. Spawn workers first."
 
+    checkpoints = ai_worker_state.load_latest_canonical_checkpoints(
+        project_root, [w.get("worker_id", "?") for w in roster]
+    )
     lines = [f"Worker Checkpoints ({len(roster)} worker(s)):\n"]
     for w in roster:
         wid = w.get("worker_id", "?")
-        cp = ai_worker_state.load_latest_canonical_checkpoint(project_root, wid)
+        cp = checkpoints[wid]
         if cp:
             lines.append(f"  {wid} ({w.get('role', '?')})")
             lines.append(f"    Checkpoint: {cp.get('checkpoint_id', '?')}")
@@ -551,17 +560,29 @@ HANDLERS = {
 }
 
 
+# commands.yaml path -> (st_mtime_ns, alias registry)
+_REG_CACHE: dict[Path, tuple[int, dict]] = {}
+
+
 def load_command_registry(project_root: Path) -> dict:
-    """Load commands.yaml and build a lookup: alias -> handler_name."""
-    try:
-        import yaml
-    except ImportError:
+    """Load commands.yaml and build a lookup: alias -> handler_name.
+
+    The parsed registry is cached per file and reused until its mtime changes.
+    """
+    if yaml is None:
         return {}
 
     commands_path = project_root / ".ai" / "state" / "commands.yaml"
-    if not commands_path.exists():
+    try:
+        mtime_ns = commands_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        _REG_CACHE.pop(commands_path, None)
         return {}
 
+    cached = _REG_CACHE.get(commands_path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
     data = yaml.safe_load(commands_path.read_text()) or {}
     registry = {}
     for cmd in data.get("commands", []):
@@ -569,6 +590,7 @@ def load_command_registry(project_root: Path) -> dict:
         for alias in [cmd.get("name", "")] + cmd.get("aliases", []):
             if alias:
                 registry[alias.lower().strip().lstrip("/")] = handler
+    _REG_CACHE[commands_path] = (mtime_ns, registry)
     return registry
 
 
@@ -631,8 +653,6 @@ def _auto_import_inbox(project_root: Path) -> str | None:
 
     Returns a status message if something was imported, None otherwise.
     """
-    from .memory_core.api import SessionMemory
-
     inbox = project_root / ".ai_runtime" / "import_inbox"
     if not inbox.exists():
         return None
@@ -680,8 +700,6 @@ def _auto_export_pack(project_root: Path) -> str | None:
 
     Returns path to export, or None on failure.
     """
-    from .memory_core.api import SessionMemory
-
     packs_dir = project_root / ".ai_runtime" / "memory_packs"
     packs_dir.mkdir(parents=True, exist_ok=True)
 
@@ -725,7 +743,7 @@ def _log_canonical_event(project_root: Path, event_type: str, detail: str):
     try:
         conn = ai_db.connect_db(runtime_dir)
         ai_db.add_event(conn, "system", event_type, {"detail": detail})
-        conn.close()
+        ai_db.release_db(conn)
     except Exception:
         pass  # Non-critical: don't break flow for logging failures
 
@@ -774,6 +792,37 @@ def get_protocol_summary(project_root: Path) -> dict:
 # ── Run Loop (with Auto-Persistence) ──
 
 
+def _parse_repl_command(cmd: str) -> tuple[str, dict]:
+    """Split a REPL line into (command, kwargs).
+
+    `--key value` pairs become kwargs (dashes in keys become underscores);
+    a bare `--flag` becomes True. Values may be quoted, e.g.
+    `configure-team --spec "3 Codex devs"`.
+    """
+    try:
+        parts = shlex.split(cmd)
+    except ValueError:  # unbalanced quotes
+        parts = cmd.split()
+    if not parts:
+        return "", {}
+
+    kwargs: dict = {}
+    i = 1
+    n = len(parts)
+    while i < n:
+        if parts[i].startswith("--"):
+            key = parts[i][2:].replace("-", "_")
+            if i + 1 < n and not parts[i + 1].startswith("--"):
+                kwargs[key] = parts[i + 1]
+                i += 2
+            else:
+                kwargs[key] = True
+                i += 1
+        else:
+            i += 1
+    return parts[0], kwargs
+
+
 def run_loop(project_root: Path):
     """Interactive orchestrator loop with automatic session memory persistence.
 
@@ -790,8 +839,6 @@ def run_loop(project_root: Path):
       - Auto-export session memory pack to memory_packs/
       - Re-render STATUS.md from current canonical state
     """
-    from .memory_core.api import SessionMemory
-
     ai_dir = project_root / ".ai"
     runtime_dir = project_root / ".ai_runtime"
 
@@ -850,6 +897,10 @@ def run_loop(project_root: Path):
     except Exception:
         print('  Say "help" or type /help to see what you can ask me to do.')
 
+    # Flush each printed line promptly even when stdout is a pipe
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=True)
+
     print("Scaffold AI running. Type commands or 'quit' to exit.")
     print("Session memory is active. All turns are persisted automatically.")
     print()
@@ -874,24 +925,7 @@ def run_loop(project_root: Path):
             mem.add_message(session_id, "orchestrator", "user", cmd)
             turn_count += 1
 
-            # Parse simple args
-            parts = cmd.split()
-            command = parts[0]
-            kwargs = {}
-
-            i = 1
-            while i < len(parts):
-                if parts[i].startswith("--"):
-                    key = parts[i][2:].replace("-", "_")
-                    if i + 1 < len(parts) and not parts[i + 1].startswith("--"):
-                        kwargs[key] = parts[i + 1]
-                        i += 2
-                    else:
-                        kwargs[key] = True
-                        i += 1
-                else:
-                    i += 1
-
+            command, kwargs = _parse_repl_command(cmd)
             result = dispatch_command(project_root, command, **kwargs)
             print(result)
             print()
@@ -899,11 +933,11 @@ def run_loop(project_root: Path):
             # Persist command response
             mem.add_message(session_id, "orchestrator", "assistant", result)
 
-            # Auto-flush state on state-changing commands
+            # Auto-flush state on state-changing commands. status, git-sync
+            # and force-sync already reconcile + render STATUS.md themselves.
             state_changing_cmds = {
-                "status", "git-sync", "validate", "spawn-workers",
-                "stop-workers", "configure-team", "workers-resume",
-                "workers-restart", "force-sync",
+                "validate", "spawn-workers", "stop-workers",
+                "configure-team", "workers-resume", "workers-restart",
             }
             cmd_lower = command.lower().lstrip("/")
             if cmd_lower in state_changing_cmds:
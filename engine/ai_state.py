@@ -7,6 +7,10 @@ Loads canonical YAML, computes hashes, reconciles with SQLite cache.
 from __future__ import annotations
 
 import hashlib
+import os
+import sys
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
 try:
@@ -14,55 +18,210 @@ try:
 except ImportError:
     yaml = None
 
-from . import ai_db
+try:
+    from blake3 import blake3
+except ImportError:
+    blake3 = None
+
+if yaml is not None:
+    # Prefer the LibYAML bindings; fall back to the pure-Python safe classes.
+    _Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    _Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+from . import ai_db, json_codec
 
 
 def _load_yaml(path: Path) -> dict:
     text = path.read_text()
     if yaml:
-        return yaml.safe_load(text) or {}
+        return yaml.load(text, Loader=_Loader) or {}
     raise ImportError("PyYAML is required. Install it: pip install pyyaml")
 
 
 def _save_yaml(path: Path, data: dict):
     if yaml:
-        path.write_text(yaml.dump(data, default_flow_style=False, sort_keys=False))
+        path.write_text(yaml.dump(data, Dumper=_Dumper, default_flow_style=False, sort_keys=False))
     else:
         raise ImportError("PyYAML is required. Install it: pip install pyyaml")
 
 
-def compute_canonical_hash(ai_dir: Path) -> str:
-    """Compute a hash of all canonical YAML files to detect changes."""
+# JSON parse cache of the state YAML, keyed by its hash (gitignored).
+CANONICAL_SIDECAR = ".canonical.json"
+# Set by our own canonical writes; forces the next reconcile to hash (gitignored).
+DIRTY_MARKER = ".dirty"
+
+_CANONICAL_STATE_FILES = sorted([
+    "team.yaml", "board.yaml", "approvals.yaml", "commands.yaml",
+    "capabilities.yaml", "providers.yaml", "intents.yaml",
+    "persistence.yaml", "recovery.yaml", "project.yaml",
+])
+
+
+def _canonical_paths(ai_dir: Path) -> tuple[Path, ...]:
+    """Files covered by the canonical hash, in hashing order."""
     state_dir = ai_dir / "state"
-    h = hashlib.sha256()
-    for name in sorted([
-        "team.yaml", "board.yaml", "approvals.yaml", "commands.yaml",
-        "capabilities.yaml", "providers.yaml", "intents.yaml",
-        "persistence.yaml", "recovery.yaml", "project.yaml",
-    ]):
-        fpath = state_dir / name
-        if fpath.exists():
-            h.update(fpath.read_bytes())
-    # Include canonical worker state
     workers_dir = ai_dir / "workers"
-    for name in sorted(["roster.yaml", "assignments.yaml"]):
-        fpath = workers_dir / name
+    return (
+        *(state_dir / name for name in _CANONICAL_STATE_FILES),
+        # Canonical worker state
+        *(workers_dir / name for name in sorted(["roster.yaml", "roster_index.json", "assignments.yaml"])),
+        # Ticket index
+        ai_dir / "tickets" / "_index.yaml",
+        # Core truths
+        ai_dir / "core_truths.yaml",
+    )
+
+
+def _stat_key(paths: tuple[Path, ...]) -> tuple:
+    """(mtime_ns, size) per path, None for missing files."""
+    key = []
+    for p in paths:
+        try:
+            st = os.stat(p)
+        except FileNotFoundError:
+            key.append(None)
+        else:
+            key.append((st.st_mtime_ns, st.st_size))
+    return tuple(key)
+
+
+_CHUNK_SIZE = 256 * 1024
+
+# The canonical hash only detects changes, so a faster non-SHA hash is fine
+# locally. Hashes are written as "<algo>:<hex>" so values from machines with
+# a different algorithm are compared like with like (canonical_hash_matches).
+_HASHERS = {"sha256": hashlib.sha256}
+if blake3 is not None:
+    _HASHERS["blake3"] = blake3
+HASH_ALGO = "blake3" if blake3 is not None else "sha256"
+
+
+def _file_digest(fpath: Path, algo: str = HASH_ALGO) -> bytes:
+    """algo digest of one file, read in fixed-size chunks."""
+    new_hasher = _HASHERS[algo]
+    with fpath.open("rb") as f:
+        if sys.version_info >= (3, 11):
+            return hashlib.file_digest(f, new_hasher).digest()
+        h = new_hasher()
+        buf = bytearray(_CHUNK_SIZE)
+        view = memoryview(buf)
+        while n := f.readinto(buf):
+            h.update(view[:n])
+        return h.digest()
+
+
+@lru_cache(maxsize=8)
+def _hash_files(paths: tuple[Path, ...], stat_key: tuple, algo: str = HASH_ALGO) -> str:
+    # stat_key is only part of the cache key: any edit changes it.
+    h = _HASHERS[algo]()
+    for fpath, st in zip(paths, stat_key):
+        if st is not None:
+            h.update(_file_digest(fpath, algo))
+    return f"{algo}:{h.hexdigest()}"
+
+
+def _hash_leaves(ai_dir: Path, paths: tuple[Path, ...], stat_key: tuple,
+                 prev_leaves: dict) -> tuple[str, dict]:
+    """Combine per-file digests into the canonical hash, reusing unchanged leaves.
+
+    Leaves map each file (relative to ai_dir) to [mtime_ns, size, digest];
+    only files whose stat differs from prev_leaves are re-read. The root
+    matches compute_canonical_hash for the same tree.
+    """
+    h = _HASHERS[HASH_ALGO]()
+    leaves = {}
+    for fpath, st in zip(paths, stat_key):
+        if st is None:
+            continue
+        name = fpath.relative_to(ai_dir).as_posix()
+        prev = prev_leaves.get(name)
+        if prev and tuple(prev[:2]) == st:
+            digest = bytes.fromhex(prev[2])
+        else:
+            digest = _file_digest(fpath)
+        leaves[name] = [*st, digest.hex()]
+        h.update(digest)
+    return f"{HASH_ALGO}:{h.hexdigest()}", leaves
+
+
+def compute_canonical_hash(ai_dir: Path, algo: str = HASH_ALGO) -> str:
+    """Compute a hash of all canonical YAML files to detect changes.
+
+    Returns "<algo>:<hex>". Results are memoized per process on each
+    file's (mtime_ns, size), so repeated calls on an unchanged tree only
+    cost a stat per file.
+    """
+    paths = _canonical_paths(ai_dir)
+    return _hash_files(paths, _stat_key(paths), algo)
+
+
+def canonical_hash_matches(ai_dir: Path, other: str) -> bool:
+    """True if hash other (e.g. from a memory pack) describes ai_dir's state.
+
+    other is recomputed with its own algorithm; unprefixed values come from
+    releases that hashed the concatenated file contents with sha256.
+    """
+    algo, sep, _ = other.partition(":")
+    if not sep:
+        return other == _legacy_canonical_hash(ai_dir)
+    if algo not in _HASHERS:
+        return False
+    return other == compute_canonical_hash(ai_dir, algo)
+
+
+def _legacy_canonical_hash(ai_dir: Path) -> str:
+    """sha256 over the concatenated canonical files, as older releases wrote."""
+    h = hashlib.sha256()
+    for fpath in _canonical_paths(ai_dir):
+        if fpath.name == "roster_index.json":
+            continue  # not part of the canonical set before the hash change
         if fpath.exists():
             h.update(fpath.read_bytes())
-    # Include ticket index
-    ticket_index = ai_dir / "tickets" / "_index.yaml"
-    if ticket_index.exists():
-        h.update(ticket_index.read_bytes())
-    # Include core truths
-    truths_path = ai_dir / "core_truths.yaml"
-    if truths_path.exists():
-        h.update(truths_path.read_bytes())
     return h.hexdigest()
 
 
 def load_canonical(ai_dir: Path) -> dict:
-    """Load all canonical YAML state files into a single dict."""
+    """Load all canonical YAML state files into a single dict.
+
+    Parsed files are memoized on their (mtime_ns, size), so reconcile and
+    render_status share one parse, and across processes a JSON sidecar
+    (.ai/state/.canonical.json) stands in for the YAML while its hash
+    matches. Treat the nested values as read-only.
+    """
     state_dir = ai_dir / "state"
+    paths = tuple(state_dir / name for name in _CANONICAL_STATE_FILES)
+    return dict(_load_canonical_cached(state_dir, paths, _stat_key(paths)))
+
+
+@lru_cache(maxsize=4)
+def _load_canonical_cached(state_dir: Path, paths: tuple[Path, ...], stat_key: tuple) -> dict:
+    # stat_key is only part of the cache key: any edit changes it.
+    digest = _hash_files(paths, stat_key)
+    sidecar = state_dir / CANONICAL_SIDECAR
+    try:
+        cached = json_codec.loads(sidecar.read_bytes())
+        if cached["hash"] == digest:
+            return cached["data"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    result = _parse_canonical(state_dir)
+    _write_sidecar(sidecar, digest, result)
+    return result
+
+
+def _write_sidecar(sidecar: Path, digest: str, data: dict) -> None:
+    """Write the JSON parse cache, skipping data that JSON can't round-trip."""
+    try:
+        text = json_codec.dumps({"hash": digest, "data": data})
+        if json_codec.loads(text)["data"] != data:
+            return  # e.g. YAML dates or non-string keys
+        sidecar.write_text(text)
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+def _parse_canonical(state_dir: Path) -> dict:
     result = {
         "team": _load_yaml(state_dir / "team.yaml"),
         "board": _load_yaml(state_dir / "board.yaml"),
@@ -80,10 +239,26 @@ def load_canonical(ai_dir: Path) -> dict:
     return result
 
 
+def mark_dirty(ai_dir: Path) -> None:
+    """Flag canonical state as written so the next reconcile re-hashes it.
+
+    Writers only drop a marker file; hashing is deferred to reconcile, which
+    then ignores the stat-based shortcuts (an in-place rewrite can keep the
+    same size and, on coarse-mtime filesystems, the same mtime).
+    """
+    _hash_files.cache_clear()
+    _load_canonical_cached.cache_clear()
+    try:
+        (ai_dir / "state" / DIRTY_MARKER).touch()
+    except OSError:
+        pass
+
+
 def save_canonical(ai_dir: Path, state: dict):
     """Save state dict back to canonical YAML files."""
     state_dir = ai_dir / "state"
     state_dir.mkdir(parents=True, exist_ok=True)
+    mark_dirty(ai_dir)
     if "team" in state:
         _save_yaml(state_dir / "team.yaml", state["team"])
     if "board" in state:
@@ -94,17 +269,44 @@ def save_canonical(ai_dir: Path, state: dict):
         _save_yaml(state_dir / "commands.yaml", state["commands"])
 
 
-def reconcile(ai_dir: Path, runtime_dir: Path) -> bool:
+def reconcile(ai_dir: Path, runtime_dir: Path, canonical_hash: str | None = None) -> bool:
     """Reconcile canonical YAML with SQLite DB.
 
+    Pass canonical_hash if the caller already computed it for ai_dir.
+    Without it, an unchanged (mtime_ns, size) per file skips hashing, and
+    only files whose stat changed are re-digested.
     Returns True if DB was updated, False if already in sync.
     """
     conn = ai_db.connect_db(runtime_dir)
-    current_hash = compute_canonical_hash(ai_dir)
+    dirty_marker = ai_dir / "state" / DIRTY_MARKER
+    dirty = dirty_marker.exists()
+    paths = _canonical_paths(ai_dir)
+    stat_key = _stat_key(paths)
+    current_stat = json_codec.dumps(stat_key)
+
+    # Fast path: nothing was touched since the last ingest, skip hashing.
+    if (
+        canonical_hash is None
+        and not dirty
+        and ai_db.get_snapshot(conn, "canonical_stat") == current_stat
+    ):
+        ai_db.release_db(conn)
+        return False
+
+    leaves = None
+    if canonical_hash is None:
+        prev_leaves = {}
+        if not dirty and ai_db.get_snapshot(conn, "canonical_hash_algo") == HASH_ALGO:
+            prev_leaves = json_codec.loads(ai_db.get_snapshot(conn, "canonical_leaves") or "{}")
+        current_hash, leaves = _hash_leaves(ai_dir, paths, stat_key, prev_leaves)
+    else:
+        current_hash = canonical_hash
     stored_hash = ai_db.get_snapshot(conn, "canonical_hash")
 
     if stored_hash == current_hash:
-        conn.close()
+        _save_stat_snapshots(conn, current_stat, leaves)
+        dirty_marker.unlink(missing_ok=True)
+        ai_db.release_db(conn)
         return False
 
     # Canonical changed (or first run) — re-ingest
@@ -113,27 +315,80 @@ def reconcile(ai_dir: Path, runtime_dir: Path) -> bool:
     ai_db.ingest_board(conn, state["board"])
     ai_db.ingest_approvals(conn, state["approvals"])
 
-    from datetime import datetime, timezone
-
     ai_db.set_snapshot(conn, "canonical_hash", current_hash)
+    _save_stat_snapshots(conn, current_stat, leaves)
     ai_db.set_snapshot(conn, "last_ingested_ts", datetime.now(timezone.utc).isoformat())
     ai_db.add_event(conn, "system", "reconcile", {"hash": current_hash})
+    dirty_marker.unlink(missing_ok=True)
 
-    conn.close()
+    ai_db.release_db(conn)
     return True
 
 
+def _save_stat_snapshots(conn, current_stat: str, leaves: dict | None) -> None:
+    ai_db.set_snapshot(conn, "canonical_stat", current_stat)
+    if leaves is not None:
+        ai_db.set_snapshot(conn, "canonical_leaves", json_codec.dumps(leaves))
+        ai_db.set_snapshot(conn, "canonical_hash_algo", HASH_ALGO)
+
+
 def _load_capabilities(ai_dir: Path) -> dict:
     """Load capabilities.yaml if present."""
     caps_path = ai_dir / "state" / "capabilities.yaml"
     if caps_path.exists() and yaml is not None:
         try:
-            return yaml.safe_load(caps_path.read_text()) or {}
+            return yaml.load(caps_path.read_text(), Loader=_Loader) or {}
         except Exception:
             pass
     return {}
 
 
+# Row templates for task listings (terminal report and STATUS.md).
+_TASK_LINE = "    - {id}: {title}{pri} ({owner})".format
+_DONE_LINE = "    - {id}: {title}".format
+_TASK_LINE_MD = "- **{id}**: {title}{pri} (owner: {owner})".format
+_DONE_LINE_MD = "- ~~{id}~~: {title}".format
+
+# Boards at least this large are classified with numpy (when installed).
+_NUMPY_MIN_TASKS = 200
+
+
+@lru_cache(maxsize=1)
+def _numpy():
+    # Imported lazily: numpy is optional and too slow to load on every CLI call.
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _classify_tasks(tasks: list, columns: list) -> tuple[dict, dict, list]:
+    """Return (counts per column, tasks per column, in-progress tasks)."""
+    np = _numpy() if len(tasks) >= _NUMPY_MIN_TASKS else None
+    if np is not None:
+        statuses = np.array([t.get("status", "backlog") for t in tasks], dtype=object)
+        tasks_by_status = {
+            col: [tasks[i] for i in np.flatnonzero(statuses == col)] for col in columns
+        }
+        active = [tasks[i] for i in np.flatnonzero(statuses == "in_progress")]
+        return {col: len(ts) for col, ts in tasks_by_status.items()}, tasks_by_status, active
+
+    # Single pass: count tasks per column, group them, and collect active ones
+    counts = {col: 0 for col in columns}
+    tasks_by_status = {col: [] for col in columns}
+    active = []
+    for task in tasks:
+        s = task.get("status", "backlog")
+        group = tasks_by_status.get(s)
+        if group is not None:
+            group.append(task)
+            counts[s] += 1
+        if s == "in_progress":
+            active.append(task)
+    return counts, tasks_by_status, active
+
+
 def render_status(ai_dir: Path, runtime_dir: Path) -> str:
     """Render a terminal-friendly status report and update STATUS.md."""
     state = load_canonical(ai_dir)
@@ -144,12 +399,7 @@ def render_status(ai_dir: Path, runtime_dir: Path) -> str:
     columns = board.get("columns", [])
     tasks = board.get("tasks", [])
 
-    # Count tasks per column
-    counts = {col: 0 for col in columns}
-    for task in tasks:
-        s = task.get("status", "backlog")
-        if s in counts:
-            counts[s] += 1
+    counts, tasks_by_status, active = _classify_tasks(tasks, columns)
 
     total = len(tasks)
     done = counts.get("done", 0)
@@ -160,26 +410,16 @@ def render_status(ai_dir: Path, runtime_dir: Path) -> str:
     filled = int(bar_width * pct / 100)
     bar = "#" * filled + "." * (bar_width - filled)
 
-    # Active tasks
-    active = [t for t in tasks if t.get("status") == "in_progress"]
-
     # Blockers (tasks blocked by approvals)
     pending_approvals = approvals.get("approval_log", [])
     pending = [a for a in pending_approvals if a.get("status") == "pending"]
 
-    # Group tasks by status
-    tasks_by_status = {col: [] for col in columns}
-    for task in tasks:
-        s = task.get("status", "backlog")
-        if s in tasks_by_status:
-            tasks_by_status[s].append(task)
-
     # Determine phase
     if total == 0:
         phase = "Initialization"
     elif done == total:
         phase = "Complete"
-    elif any(t.get("status") == "in_progress" for t in tasks):
+    elif active:
         phase = "Active Development"
     else:
         phase = "Planning"
@@ -211,19 +451,18 @@ def render_status(ai_dir: Path, runtime_dir: Path) -> str:
         if not col_tasks:
             continue
         lines.append(f"  {col.upper().replace('_', ' ')} ({len(col_tasks)}):")
-        for t in col_tasks:
-            owner = t.get("owner_role", "unassigned")
-            priority = t.get("priority", "")
-            pri_tag = f" [{priority}]" if priority else ""
-            lines.append(f"    - {t['id']}: {t['title']}{pri_tag} ({owner})")
+        lines.extend(
+            _TASK_LINE(id=t["id"], title=t["title"], owner=t.get("owner_role", "unassigned"),
+                       pri=f" [{p}]" if (p := t.get("priority", "")) else "")
+            for t in col_tasks
+        )
         lines.append("")
 
     # Done tasks (collapsed list)
     done_tasks = tasks_by_status.get("done", [])
     if done_tasks:
         lines.append(f"  DONE ({len(done_tasks)}):")
-        for t in done_tasks:
-            lines.append(f"    - {t['id']}: {t['title']}")
+        lines.extend(_DONE_LINE(id=t["id"], title=t["title"]) for t in done_tasks)
         lines.append("")
 
     # Worker Bees — infographic-style team visualization
@@ -289,8 +528,6 @@ def render_status(ai_dir: Path, runtime_dir: Path) -> str:
 
 def _write_status_md(ai_dir, phase, columns, counts, total, done, pct,
                      active, pending, tasks_by_status):
-    from datetime import datetime, timezone
-
     bar_width = 20
     filled = int(bar_width * pct / 100)
     bar_md = "#" * filled + "." * (bar_width - filled)
@@ -316,19 +553,18 @@ def _write_status_md(ai_dir, phase, columns, counts, total, done, pct,
         if not col_tasks:
             continue
         lines.append(f"## {col.replace('_', ' ').title()} ({len(col_tasks)})")
-        for t in col_tasks:
-            owner = t.get("owner_role", "unassigned")
-            priority = t.get("priority", "")
-            pri_tag = f" `{priority}`" if priority else ""
-            lines.append(f"- **{t['id']}**: {t['title']}{pri_tag} (owner: {owner})")
+        lines.extend(
+            _TASK_LINE_MD(id=t["id"], title=t["title"], owner=t.get("owner_role", "unassigned"),
+                          pri=f" `{p}`" if (p := t.get("priority", "")) else "")
+            for t in col_tasks
+        )
         lines.append("")
 
     # Done tasks
     done_tasks = tasks_by_status.get("done", [])
     if done_tasks:
         lines.append(f"## Done ({len(done_tasks)})")
-        for t in done_tasks:
-            lines.append(f"- ~~{t['id']}~~: {t['title']}")
+        lines.extend(_DONE_LINE_MD(id=t["id"], title=t["title"]) for t in done_tasks)
         lines.append("")
 
     if pending:
@@ -346,12 +582,34 @@ def _write_status_md(ai_dir, phase, columns, counts, total, done, pct,
 
     # Preserve Legacy Snapshot section if it exists in the current STATUS.md
     status_path = ai_dir / "STATUS.md"
-    legacy_section = ""
-    if status_path.exists():
-        existing = status_path.read_text()
-        marker = "## Legacy Status Snapshot"
-        idx = existing.find(marker)
-        if idx >= 0:
-            legacy_section = "\n\n" + existing[idx:]
-
-    (ai_dir / "STATUS.md").write_text("\n".join(lines) + legacy_section + "\n")
+    legacy_section = _legacy_status_section(status_path)
+
+    tmp_path = status_path.with_suffix(".md.tmp")
+    tmp_path.write_text("\n".join(lines) + legacy_section + "\n")
+    os.replace(tmp_path, status_path)
+    _LEGACY_CACHE[status_path] = (status_path.stat().st_mtime_ns, legacy_section)
+
+
+# STATUS.md path -> (mtime_ns when last read/written, legacy section text)
+_LEGACY_CACHE: dict[Path, tuple[int, str]] = {}
+
+
+def _legacy_status_section(status_path: Path) -> str:
+    """Return the "## Legacy Status Snapshot" tail of STATUS.md ("" if none).
+
+    Cached on mtime so our own rewrites don't trigger a re-read.
+    """
+    try:
+        mtime_ns = status_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return ""
+    cached = _LEGACY_CACHE.get(status_path)
+    if cached and cached[0] == mtime_ns:
+        return cached[1]
+
+    existing = status_path.read_text()
+    idx = existing.find("## Legacy Status Snapshot")
+    # Drop the trailing newline we append on write so rewrites don't grow it.
+    legacy_section = "\n\n" + existing[idx:].rstrip("\n") if idx >= 0 else ""
+    _LEGACY_CACHE[status_path] = (mtime_ns, legacy_section)
+    return legacy_section
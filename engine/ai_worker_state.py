@@ -6,6 +6,7 @@ This enables workers to resume on any machine without .ai_runtime/.
 
 Storage layout:
   .ai/workers/roster.yaml          — Worker roster (id, role, provider, status)
+  .ai/workers/roster_index.json    — worker_id → last_checkpoint_id (overrides roster)
   .ai/workers/assignments.yaml     — Worker → ticket ID mappings
   .ai/workers/checkpoints/<id>/    — Markdown checkpoints per worker
   .ai/workers/summaries/<id>.md    — Latest state summary per worker
@@ -13,27 +14,63 @@ Storage layout:
 
 from __future__ import annotations
 
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Callable
 
 try:
     import yaml
 except ImportError:
     yaml = None  # type: ignore[assignment]
 
+from . import ai_state, json_codec
+
+if yaml is not None:
+    # Prefer the LibYAML bindings; fall back to the pure-Python safe classes.
+    _Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    _Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 def _yaml_dump(data: dict) -> str:
     if yaml:
-        return yaml.dump(data, default_flow_style=False, sort_keys=False)
+        return yaml.dump(data, Dumper=_Dumper, default_flow_style=False, sort_keys=False)
     raise ImportError("PyYAML is required. Install it: pip install pyyaml")
 
 
+# Directories already created by this process (skips repeat mkdir calls).
+_ENSURED_DIRS: set[Path] = set()
+
+
+def _ensure_dir(path: Path) -> Path:
+    if path not in _ENSURED_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(path)
+    return path
+
+
+def _write_ensured(path: Path, write: Callable[[Path], object]) -> None:
+    """Call write(path), recreating path's directory if it vanished.
+
+    _ENSURED_DIRS outlives the directories it remembers (git clean or a
+    checkout can remove .ai/workers mid-session), so on FileNotFoundError
+    the memo is dropped, the directory recreated and the write retried once.
+    """
+    try:
+        write(path)
+    except FileNotFoundError:
+        _ENSURED_DIRS.clear()
+        _ensure_dir(path.parent)
+        write(path)
+
+
 def ensure_workers_dir(project_root: Path) -> Path:
     """Create .ai/workers/ directory structure if missing. Returns workers dir."""
     workers_dir = project_root / ".ai" / "workers"
     for subdir in ["checkpoints", "summaries"]:
-        (workers_dir / subdir).mkdir(parents=True, exist_ok=True)
+        _ensure_dir(workers_dir / subdir)
     return workers_dir
 
 
@@ -44,19 +81,23 @@ def write_roster(project_root: Path, workers_list: list[dict]) -> Path:
     """
     workers_dir = ensure_workers_dir(project_root)
     roster_path = workers_dir / "roster.yaml"
+    index = _load_checkpoint_index(project_root)
 
     entries = []
     for w in workers_list:
+        worker_id = w.get("worker_id", "")
         entries.append({
-            "worker_id": w.get("worker_id", ""),
+            "worker_id": worker_id,
             "role": w.get("role", ""),
             "provider": w.get("provider", ""),
             "model": w.get("model", ""),
             "status": w.get("status", "ready"),
-            "last_checkpoint_id": w.get("last_checkpoint_id"),
+            "last_checkpoint_id": index.get(worker_id, w.get("last_checkpoint_id")),
         })
 
-    roster_path.write_text(_yaml_dump({"workers": entries}))
+    roster_text = _yaml_dump({"workers": entries})
+    _write_ensured(roster_path, lambda p: p.write_text(roster_text))
+    ai_state.mark_dirty(project_root / ".ai")
     return roster_path
 
 
@@ -66,10 +107,29 @@ def load_roster(project_root: Path) -> list[dict]:
     if not roster_path.exists() or yaml is None:
         return []
     try:
-        data = yaml.safe_load(roster_path.read_text()) or {}
-        return data.get("workers", [])
+        data = yaml.load(roster_path.read_text(), Loader=_Loader) or {}
+        workers = data.get("workers", [])
     except Exception:
         return []
+    index = _load_checkpoint_index(project_root)
+    if index:
+        for w in workers:
+            if w.get("worker_id") in index:
+                w["last_checkpoint_id"] = index[w["worker_id"]]
+    return workers
+
+
+def _checkpoint_index_path(project_root: Path) -> Path:
+    return project_root / ".ai" / "workers" / "roster_index.json"
+
+
+def _load_checkpoint_index(project_root: Path) -> dict[str, str]:
+    """Load roster_index.json (worker_id → last_checkpoint_id)."""
+    try:
+        index = json_codec.loads(_checkpoint_index_path(project_root).read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return index if isinstance(index, dict) else {}
 
 
 def write_canonical_checkpoint(
@@ -89,8 +149,7 @@ def write_canonical_checkpoint(
     now = datetime.now(timezone.utc)
     checkpoint_id = now.strftime("%Y%m%d_%H%M%S")
 
-    cp_dir = ensure_workers_dir(project_root) / "checkpoints" / worker_id
-    cp_dir.mkdir(parents=True, exist_ok=True)
+    cp_dir = _ensure_dir(ensure_workers_dir(project_root) / "checkpoints" / worker_id)
 
     role = data.get("role", "")
     provider = data.get("provider", "")
@@ -103,41 +162,17 @@ def write_canonical_checkpoint(
         "",
     ]
 
-    # Completed
-    completed = data.get("completed", [])
-    if completed:
-        lines.append("## Completed")
-        for item in completed:
-            lines.append(f"- {item}")
-        lines.append("")
-
-    # Pending
-    pending = data.get("pending", [])
-    if pending:
-        lines.append("## Pending")
-        for item in pending:
-            lines.append(f"- {item}")
-        lines.append("")
-
-    # Files changed
-    files_changed = data.get("files_changed", [])
-    if files_changed:
-        lines.append("## Files Changed")
-        for item in files_changed:
-            lines.append(f"- {item}")
-        lines.append("")
-
-    # Decisions
-    decisions = data.get("decisions", [])
-    if decisions:
-        lines.append("## Decisions")
-        for item in decisions:
-            lines.append(f"- {item}")
-        lines.append("")
+    # Bullet sections: Completed, Pending, Files Changed, Decisions
+    for heading, key in _LIST_SECTIONS.items():
+        items = data.get(key, [])
+        if items:
+            lines.append(f"## {heading}")
+            lines.extend(map(_BULLET, items))
+            lines.append("")
 
     # Progress summary (fallback from existing checkpoint format)
     progress = data.get("progress_summary", "")
-    if progress and not completed:
+    if progress and not data.get("completed"):
         lines.append("## Progress")
         lines.append(progress)
         lines.append("")
@@ -150,30 +185,42 @@ def write_canonical_checkpoint(
         lines.append("")
 
     cp_path = cp_dir / f"{checkpoint_id}.md"
-    cp_path.write_text("\n".join(lines))
+    payload = "\n".join(lines).encode()
+    _write_ensured(cp_path, lambda p: _write_file(p, payload))
 
-    # Update roster with checkpoint ref
-    _update_roster_checkpoint(project_root, worker_id, checkpoint_id)
+    # Record the checkpoint ref without rewriting roster.yaml
+    _bump_checkpoint_index(project_root, worker_id, checkpoint_id)
 
     return checkpoint_id
 
 
-def _update_roster_checkpoint(
+def _write_file(path: Path, payload: bytes) -> None:
+    """Write payload with raw os.open/os.write (no buffered file object)."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _bump_checkpoint_index(
     project_root: Path, worker_id: str, checkpoint_id: str
 ) -> None:
-    """Update last_checkpoint_id in roster.yaml for a worker."""
-    roster_path = project_root / ".ai" / "workers" / "roster.yaml"
-    if not roster_path.exists() or yaml is None:
-        return
+    """Set last_checkpoint_id for a worker in roster_index.json.
+
+    Only the small JSON index is rewritten per checkpoint; roster.yaml picks
+    the value up the next time write_roster runs.
+    """
+    index = _load_checkpoint_index(project_root)
+    index[worker_id] = checkpoint_id
     try:
-        data = yaml.safe_load(roster_path.read_text()) or {}
-        for w in data.get("workers", []):
-            if w.get("worker_id") == worker_id:
-                w["last_checkpoint_id"] = checkpoint_id
-                break
-        roster_path.write_text(_yaml_dump(data))
-    except Exception:
-        pass
+        index_text = json_codec.dumps(index, indent=True) + "\n"
+        _write_ensured(_checkpoint_index_path(project_root), lambda p: p.write_text(index_text))
+    except OSError:
+        return
+    ai_state.mark_dirty(project_root / ".ai")
 
 
 def load_latest_canonical_checkpoint(
@@ -185,51 +232,97 @@ def load_latest_canonical_checkpoint(
     timestamp, progress_summary, next_steps (parsed from markdown).
     Returns None if no checkpoint found.
     """
-    cp_dir = project_root / ".ai" / "workers" / "checkpoints" / worker_id
-    if not cp_dir.is_dir():
+    path = _latest_checkpoint_path(project_root, worker_id)
+    if path is None:
         return None
+    return _parse_checkpoint_md(path)
 
-    files = sorted(cp_dir.glob("*.md"), reverse=True)
-    if not files:
-        return None
 
-    return _parse_checkpoint_md(files[0])
+def load_latest_canonical_checkpoints(
+    project_root: Path, worker_ids: list[str]
+) -> dict[str, dict | None]:
+    """Load the latest canonical checkpoint for several workers at once.
+
+    The small checkpoint reads are issued from a thread pool so their I/O
+    overlaps. Returns {worker_id: checkpoint dict or None}.
+    """
+    paths = {wid: _latest_checkpoint_path(project_root, wid) for wid in worker_ids}
+    found = [(wid, p) for wid, p in paths.items() if p is not None]
+    result: dict[str, dict | None] = dict.fromkeys(worker_ids)
+    if not found:
+        return result
+    with ThreadPoolExecutor(max_workers=min(16, len(found))) as pool:
+        texts = pool.map(lambda item: item[1].read_text(), found)
+        for (wid, p), text in zip(found, texts):
+            result[wid] = _parse_checkpoint_md(p, text)
+    return result
 
 
-def _parse_checkpoint_md(path: Path) -> dict:
-    """Parse a markdown checkpoint file into a dict."""
-    text = path.read_text()
+def _latest_checkpoint_path(project_root: Path, worker_id: str) -> Path | None:
+    cp_dir = project_root / ".ai" / "workers" / "checkpoints" / worker_id
+    try:
+        with os.scandir(cp_dir) as it:
+            # Names are %Y%m%d_%H%M%S, so the lexicographic max is the newest.
+            latest = max(
+                (e.name for e in it if e.name.endswith(".md") and not e.name.startswith(".")),
+                default=None,
+            )
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return cp_dir / latest if latest is not None else None
+
+
+_HEADER_RE = re.compile(
+    r"Worker:\s*(\S+)\s*\|\s*Role:\s*(\S+)\s*\|\s*Provider:\s*(\S+)"
+    r"(?:[ \t]*\n\s*Timestamp:\s*(.+))?"
+)
+_TIMESTAMP_RE = re.compile(r"Timestamp:\s*(.+)")
+_SECTION_RE = re.compile(r"^## (.*)$", re.MULTILINE)
+
+_BULLET = "- {}".format
+
+# Checkpoint section heading -> result key.
+_LIST_SECTIONS = {
+    "Completed": "completed",
+    "Pending": "pending",
+    "Files Changed": "files_changed",
+    "Decisions": "decisions",
+}
+_TEXT_SECTIONS = {
+    "Progress": "progress_summary",
+    "Resume Instructions": "next_steps",
+}
+
+
+def _parse_checkpoint_md(path: Path, text: str | None = None) -> dict:
+    """Parse a markdown checkpoint file (or its already-read text) into a dict."""
+    if text is None:
+        text = path.read_text()
     result: dict = {
         "checkpoint_id": path.stem,
         "source": "canonical",
     }
 
-    # Parse header line: "Worker: X | Role: Y | Provider: Z"
-    header_match = re.search(r"Worker:\s*(\S+)\s*\|\s*Role:\s*(\S+)\s*\|\s*Provider:\s*(\S+)", text)
+    # Parse header lines: "Worker: X | Role: Y | Provider: Z" + "Timestamp: T"
+    timestamp = None
+    header_match = _HEADER_RE.search(text)
     if header_match:
-        result["worker_id"] = header_match.group(1)
-        result["role"] = header_match.group(2)
-        result["provider"] = header_match.group(3)
-
-    # Parse timestamp
-    ts_match = re.search(r"Timestamp:\s*(.+)", text)
-    if ts_match:
-        result["timestamp"] = ts_match.group(1).strip()
+        result["worker_id"], result["role"], result["provider"], timestamp = header_match.groups()
+    if timestamp is None:
+        ts_match = _TIMESTAMP_RE.search(text)
+        timestamp = ts_match.group(1) if ts_match else None
+    if timestamp is not None:
+        result["timestamp"] = timestamp.strip()
 
     # Parse sections
-    sections = _extract_sections(text)
-    if "Completed" in sections:
-        result["completed"] = _parse_bullet_list(sections["Completed"])
-    if "Pending" in sections:
-        result["pending"] = _parse_bullet_list(sections["Pending"])
-    if "Files Changed" in sections:
-        result["files_changed"] = _parse_bullet_list(sections["Files Changed"])
-    if "Decisions" in sections:
-        result["decisions"] = _parse_bullet_list(sections["Decisions"])
-    if "Progress" in sections:
-        result["progress_summary"] = sections["Progress"].strip()
-    if "Resume Instructions" in sections:
-        result["next_steps"] = sections["Resume Instructions"].strip()
+    for heading, body in _extract_sections(text).items():
+        key = _LIST_SECTIONS.get(heading)
+        if key is not None:
+            result[key] = _parse_bullet_list(body)
+            continue
+        key = _TEXT_SECTIONS.get(heading)
+        if key is not None:
+            result[key] = body.strip()
 
     return result
 
@@ -237,32 +330,24 @@ def _parse_checkpoint_md(path: Path) -> dict:
 def _extract_sections(text: str) -> dict[str, str]:
     """Extract ## sections from markdown text."""
     sections: dict[str, str] = {}
-    current_section = None
-    current_content: list[str] = []
-
-    for line in text.split("\n"):
-        if line.startswith("## "):
-            if current_section:
-                sections[current_section] = "\n".join(current_content)
-            current_section = line[3:].strip()
-            current_content = []
-        elif current_section is not None:
-            current_content.append(line)
-
-    if current_section:
-        sections[current_section] = "\n".join(current_content)
-
+    headings = list(_SECTION_RE.finditer(text))
+    for i, m in enumerate(headings):
+        name = m.group(1).strip()
+        if not name:
+            continue
+        # Body runs from the line after the heading to the newline before the next one.
+        end = headings[i + 1].start() - 1 if i + 1 < len(headings) else len(text)
+        sections[name] = text[m.end() + 1:end]
     return sections
 
 
 def _parse_bullet_list(text: str) -> list[str]:
     """Parse markdown bullet list into list of strings."""
-    items = []
-    for line in text.strip().split("\n"):
-        line = line.strip()
-        if line.startswith("- "):
-            items.append(line[2:])
-    return items
+    return [
+        line[2:]
+        for line in map(str.strip, text.strip().split("\n"))
+        if line.startswith("- ")
+    ]
 
 
 def write_summary(project_root: Path, worker_id: str, data: dict) -> Path:
@@ -273,7 +358,6 @@ def write_summary(project_root: Path, worker_id: str, data: dict) -> Path:
               last_checkpoint_id, responsibilities, open_tickets, latest_progress.
     """
     summaries_dir = ensure_workers_dir(project_root) / "summaries"
-    summaries_dir.mkdir(parents=True, exist_ok=True)
 
     title = data.get("title", data.get("role", worker_id))
     provider = data.get("provider", "?")
@@ -314,7 +398,8 @@ def write_summary(project_root: Path, worker_id: str, data: dict) -> Path:
         lines.append("")
 
     summary_path = summaries_dir / f"{worker_id}.md"
-    summary_path.write_text("\n".join(lines))
+    summary_text = "\n".join(lines)
+    _write_ensured(summary_path, lambda p: p.write_text(summary_text))
     return summary_path
 
 
@@ -333,14 +418,12 @@ def sync_from_runtime(project_root: Path) -> str:
     - .ai/workers/roster.yaml
     - .ai/workers/summaries/<worker_id>.md for each worker
     """
-    import json
-
     registry_path = project_root / ".ai_runtime" / "workers" / "registry.json"
     if not registry_path.exists():
         return "No runtime worker registry found."
 
     try:
-        registry = json.loads(registry_path.read_text())
+        registry = json_codec.loads(registry_path.read_bytes())
     except Exception:
         return "Failed to read runtime worker registry."
 
@@ -351,12 +434,9 @@ def sync_from_runtime(project_root: Path) -> str:
     # Write roster
     write_roster(project_root, workers)
 
-    # Write summaries
-    for w in workers:
-        worker_id = w.get("worker_id", "")
-        if not worker_id:
-            continue
-        write_summary(project_root, worker_id, {
+    # Write summaries (independent files, so overlap the I/O)
+    def _write(w: dict) -> None:
+        write_summary(project_root, w["worker_id"], {
             "role": w.get("role", ""),
             "provider": w.get("provider", ""),
             "model": w.get("model", ""),
@@ -364,4 +444,9 @@ def sync_from_runtime(project_root: Path) -> str:
             "last_checkpoint_id": w.get("last_checkpoint_id"),
         })
 
+    to_write = [w for w in workers if w.get("worker_id")]
+    if to_write:
+        with ThreadPoolExecutor(max_workers=min(32, len(to_write))) as pool:
+            list(pool.map(_write, to_write))
+
     return f"Synced {len(workers)} worker(s) to canonical state."
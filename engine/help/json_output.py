@@ -8,9 +8,13 @@ from __future__ import annotations
 
 import json
 
+from .. import json_codec
 from .model import HelpGuide
 
 
 def render_help_json(guide: HelpGuide, indent: int = 2) -> str:
     """Serialize a HelpGuide to JSON string."""
-    return json.dumps(guide.to_dict(), indent=indent, ensure_ascii=False)
+    data = guide.to_dict()
+    if indent == 2 and json_codec.orjson is not None:
+        return json_codec.dumps(data, indent=True)
+    return json.dumps(data, indent=indent, ensure_ascii=False)
@@ -7,7 +7,7 @@ Terminal and JSON renderers both consume this model.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -18,7 +18,7 @@ class HelpIntent:
     description: str = ""
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {"prompt": self.prompt, "command": self.command, "description": self.description}
 
 
 @dataclass
@@ -43,7 +43,7 @@ class HelpCommand:
     example: str = ""
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {"name": self.name, "description": self.description, "example": self.example}
 
 
 @dataclass
@@ -52,7 +52,7 @@ class HelpFileLocation:
     description: str
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {"path": self.path, "description": self.description}
 
 
 @dataclass
@@ -65,7 +65,14 @@ class HelpCurrentState:
     worker_count: int = 0
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {
+            "initialized": self.initialized,
+            "assignments_configured": self.assignments_configured,
+            "memory_runtime_present": self.memory_runtime_present,
+            "memory_pack_available": self.memory_pack_available,
+            "task_count": self.task_count,
+            "worker_count": self.worker_count,
+        }
 
 
 @dataclass
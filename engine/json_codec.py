@@ -0,0 +1,55 @@
+"""
+json_codec.py — JSON encode/decode shim for hot serialization paths.
+
+Uses orjson when installed, falling back to the stdlib json module.
+Output is semantically identical either way; only whitespace differs.
+"""
+
+from __future__ import annotations
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    _OPTS = orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj, indent: bool = False) -> str:
+        """Serialize obj to a JSON string (2-space indent if requested)."""
+        opts = _OPTS | orjson.OPT_INDENT_2 if indent else _OPTS
+        try:
+            return orjson.dumps(obj, option=opts).decode()
+        except TypeError:
+            # Values orjson rejects (e.g. ints beyond 64 bits) but json accepts
+            return json.dumps(obj, indent=2 if indent else None)
+
+    def dumps_line(obj) -> bytes:
+        """Serialize obj to a newline-terminated JSON line (bytes)."""
+        try:
+            return orjson.dumps(obj, option=_OPTS | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            return (json.dumps(obj) + "\n").encode()
+
+    def loads(data):
+        """Parse JSON text or bytes."""
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity written by the stdlib encoder; re-raises if truly invalid
+            return json.loads(data)
+
+else:
+
+    def dumps(obj, indent: bool = False) -> str:
+        """Serialize obj to a JSON string (2-space indent if requested)."""
+        return json.dumps(obj, indent=2 if indent else None)
+
+    def dumps_line(obj) -> bytes:
+        """Serialize obj to a newline-terminated JSON line (bytes)."""
+        return (json.dumps(obj) + "\n").encode()
+
+    loads = json.loads
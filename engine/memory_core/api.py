@@ -41,7 +41,7 @@ class SessionMemory:
         self._project_root = Path(project_root)
         self._db_path = _store.get_db_path(self._project_root, db_path)
         self._conn: sqlite3.Connection | None = None
-        self._fts_enabled: bool = False
+        self._fts_module: str | None = None
 
         # Load policy
         if policy_path is None:
@@ -55,7 +55,7 @@ class SessionMemory:
         """Lazy database connection."""
         if self._conn is None:
             self._conn = _store.connect(self._db_path)
-            self._fts_enabled = _store.ensure_fts(self._conn)
+            self._fts_module = _store.ensure_fts(self._conn)
         return self._conn
 
     def close(self):
@@ -119,7 +119,8 @@ class SessionMemory:
         """Search messages by content. Returns model-ready dicts."""
         messages = _search.search_messages(
             self.conn, session_id, namespace, query, limit,
-            use_fts=self._fts_enabled,
+            use_fts=self._fts_module is not None,
+            fts_module=self._fts_module,
         )
         return [m.to_dict() for m in messages]
 
@@ -159,7 +160,8 @@ class SessionMemory:
             if query:
                 facts = _search.search_facts(
                     self.conn, session_id, namespace, query, max_facts,
-                    use_fts=self._fts_enabled,
+                    use_fts=self._fts_module is not None,
+                    fts_module=self._fts_module,
                 )
             else:
                 facts_raw = _store.get_facts(self.conn, session_id, namespace, max_facts)
@@ -0,0 +1,53 @@
+"""
+json_codec.py — JSON encode/decode for memory rows and packs.
+
+Uses orjson when installed, falling back to the stdlib json module.
+Kept local to memory_core so the package has no engine imports.
+"""
+
+from __future__ import annotations
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+
+    def dumps(obj) -> str:
+        """Serialize obj to a compact JSON string for a TEXT column."""
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # Values orjson rejects (e.g. ints beyond 64 bits) but json accepts
+            return json.dumps(obj)
+
+    def loads(data):
+        """Parse JSON text or bytes."""
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity written by the stdlib encoder; re-raises if truly invalid
+            return json.loads(data)
+
+    def dumps_line(obj) -> bytes:
+        """Serialize obj to a newline-terminated JSON line (bytes)."""
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            return (json.dumps(obj) + "\n").encode()
+
+else:
+
+    def dumps(obj) -> str:
+        """Serialize obj to a compact JSON string for a TEXT column."""
+        return json.dumps(obj)
+
+    loads = json.loads
+
+    def dumps_line(obj) -> bytes:
+        """Serialize obj to a newline-terminated JSON line (bytes)."""
+        return (json.dumps(obj) + "\n").encode()
@@ -11,10 +11,43 @@ import hashlib
 import json
 import shutil
 import sqlite3
+import sys
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
+
+from . import json_codec
+
+_IMPORT_BATCH_SIZE = 5000
+_HASH_BLOCK_SIZE = 64 * 1024
+# Fastest DEFLATE level: several times less CPU than the default 6 for
+# slightly larger packs.
+_ZIP_COMPRESSLEVEL = 1
+
+# Relaxed settings for the duration of import_pack. The pack file remains the
+# source of truth, so losing an in-flight import to a power cut is acceptable.
+# journal_mode stays WAL: turning the journal off would break the rollback
+# that keeps a failed import all-or-nothing.
+_BULK_LOAD_PRAGMAS = {
+    "synchronous": "OFF",
+    "temp_store": "MEMORY",
+    "cache_size": "-65536",
+}
+
+# Per-row FTS insert triggers, suspended during import_pack and replaced by
+# one INSERT ... SELECT over the imported id range.
+_FTS_INSERT_TRIGGERS = {
+    "messages_ai": (
+        "messages",
+        "INSERT INTO messages_fts(rowid, content) SELECT id, content FROM messages WHERE id > ?",
+    ),
+    "facts_ai": (
+        "facts",
+        "INSERT INTO facts_fts(rowid, fact_text) SELECT id, fact_text FROM facts WHERE id > ?",
+    ),
+}
 
 
 def export_pack(
@@ -93,15 +126,17 @@ def export_pack(
             "summaries": _count(conn, "summaries", ns_filter, ns_params),
         },
     }
-    manifest_path = pack_dir / "manifest.json"
-    manifest_path.write_text(json.dumps(manifest, indent=2))
-    checksums["manifest.json"] = _sha256_file(manifest_path)
+    with _HashingWriter(pack_dir / "manifest.json") as f:
+        f.write(json.dumps(manifest, indent=2).encode())
+    checksums["manifest.json"] = f.hexdigest()
 
     # Checksums
     (pack_dir / "checksums.json").write_text(json.dumps(checksums, indent=2))
 
     if is_zip:
-        with zipfile.ZipFile(str(out), "w", zipfile.ZIP_DEFLATED) as zf:
+        with zipfile.ZipFile(
+            str(out), "w", zipfile.ZIP_DEFLATED, compresslevel=_ZIP_COMPRESSLEVEL,
+        ) as zf:
             for fpath in pack_dir.rglob("*"):
                 if fpath.is_file():
                     zf.write(str(fpath), fpath.relative_to(pack_dir))
@@ -125,44 +160,61 @@ def import_pack(
         Dict of counts imported per table.
     """
     path = Path(pack_path).resolve()
-    cleanup_dir: Path | None = None
 
-    # Handle zip
+    # Zips are read member by member; nothing is extracted to disk
     if path.suffix == ".zip" and path.is_file():
-        extract_dir = path.parent / f"_import_tmp_{path.stem}"
-        if extract_dir.exists():
-            shutil.rmtree(str(extract_dir))
-        extract_dir.mkdir(parents=True)
         with zipfile.ZipFile(str(path), "r") as zf:
-            zf.extractall(str(extract_dir))
-        path = extract_dir
-        cleanup_dir = extract_dir
+            return _import_from(conn, zf)
 
     if not path.is_dir():
         raise FileNotFoundError(f"Not a valid memory pack: {pack_path}")
+    return _import_from(conn, path)
 
-    manifest_path = path / "manifest.json"
-    if not manifest_path.exists():
-        raise ValueError("No manifest.json found in memory pack.")
 
-    manifest = json.loads(manifest_path.read_text())
+def _import_from(conn: sqlite3.Connection, pack: zipfile.ZipFile | Path) -> dict[str, int]:
+    """Validate and import an open zip or unpacked pack directory."""
+    manifest_file = _open_pack_entry(pack, "manifest.json")
+    if manifest_file is None:
+        raise ValueError("No manifest.json found in memory pack.")
+    with manifest_file:
+        manifest = json.loads(manifest_file.read())
     if manifest.get("version") != "1.0":
         raise ValueError(f"Unsupported pack version: {manifest.get('version')}")
 
     # Validate checksums
-    checksums_path = path / "checksums.json"
-    if checksums_path.exists():
-        checksums = json.loads(checksums_path.read_text())
-        for filename, expected_hash in checksums.items():
-            fpath = path / filename
-            if fpath.exists() and _sha256_file(fpath) != expected_hash:
-                raise ValueError(f"Checksum mismatch for {filename}")
+    checksums_file = _open_pack_entry(pack, "checksums.json")
+    if checksums_file is not None:
+        with checksums_file:
+            checksums = json.loads(checksums_file.read())
+        _verify_checksums(pack, checksums)
 
     counts: dict[str, int] = {}
 
+    # One transaction for the whole pack: a bad record leaves nothing half-imported
+    saved = _apply_pragmas(conn, _BULK_LOAD_PRAGMAS)
+    try:
+        with conn:
+            # Explicit BEGIN so the trigger DDL below rolls back with the rows
+            if not conn.in_transaction:
+                conn.execute("BEGIN")
+            suspended = _suspend_fts_triggers(conn)
+            _import_tables(conn, pack, counts)
+            _resume_fts_triggers(conn, suspended)
+    finally:
+        _apply_pragmas(conn, saved)
+
+    return counts
+
+
+def _import_tables(
+    conn: sqlite3.Connection,
+    pack: zipfile.ZipFile | Path,
+    counts: dict[str, int],
+) -> None:
+    """Insert each table's JSONL from a pack (caller commits)."""
     # Import messages
     counts["messages"] = _import_jsonl(
-        conn, path / "messages.jsonl",
+        conn, pack, "messages.jsonl",
         "INSERT INTO messages (session_id, namespace, role, content, ts, metadata_json) "
         "VALUES (?, ?, ?, ?, ?, ?)",
         ["session_id", "namespace", "role", "content", "ts", "metadata_json"],
@@ -170,7 +222,7 @@ def import_pack(
 
     # Import facts
     counts["facts"] = _import_jsonl(
-        conn, path / "facts.jsonl",
+        conn, pack, "facts.jsonl",
         "INSERT INTO facts (session_id, namespace, fact_text, ts, importance, tags_json, supersedes_id) "
         "VALUES (?, ?, ?, ?, ?, ?, ?)",
         ["session_id", "namespace", "fact_text", "ts", "importance", "tags_json", "supersedes_id"],
@@ -178,30 +230,43 @@ def import_pack(
 
     # Import summaries
     counts["summaries"] = _import_jsonl(
-        conn, path / "summaries.jsonl",
+        conn, pack, "summaries.jsonl",
         "INSERT INTO summaries (session_id, namespace, summary_text, ts, scope) "
         "VALUES (?, ?, ?, ?, ?)",
         ["session_id", "namespace", "summary_text", "ts", "scope"],
     )
 
     # Import events (optional)
-    events_path = path / "events.jsonl"
-    if events_path.exists():
+    if _has_pack_entry(pack, "events.jsonl"):
         counts["events"] = _import_jsonl(
-            conn, events_path,
+            conn, pack, "events.jsonl",
             "INSERT INTO events (ts, type, payload_json) VALUES (?, ?, ?)",
             ["ts", "type", "payload_json"],
         )
 
-    conn.commit()
 
-    if cleanup_dir and cleanup_dir.exists():
-        shutil.rmtree(str(cleanup_dir))
+# ── Helpers ──
 
-    return counts
+class _HashingWriter:
+    """Binary file writer that SHA-256s everything it writes."""
 
+    def __init__(self, path: Path):
+        self._f = open(path, "wb")
+        self._h = hashlib.sha256()
+
+    def write(self, data: bytes) -> None:
+        self._h.update(data)
+        self._f.write(data)
+
+    def hexdigest(self) -> str:
+        return self._h.hexdigest()
+
+    def __enter__(self) -> "_HashingWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._f.close()
 
-# ── Helpers ──
 
 def _export_jsonl(
     conn: sqlite3.Connection,
@@ -210,48 +275,134 @@ def _export_jsonl(
     params: list[str],
     checksums: dict[str, str],
 ):
-    """Export query results as JSONL."""
-    rows = conn.execute(query, params).fetchall()
-    with open(out_file, "w") as f:
-        for row in rows:
-            f.write(json.dumps(dict(row)) + "\n")
-    checksums[out_file.name] = _sha256_file(out_file)
+    """Export query results as JSONL, hashing the bytes as they are written."""
+    # Plain tuples zipped against the column names once, rather than
+    # sqlite3.Row objects converted key by key
+    cur = conn.cursor()
+    cur.row_factory = None
+    cur.execute(query, params)
+    columns = [d[0] for d in cur.description]
+    with _HashingWriter(out_file) as f:
+        for row in cur:
+            f.write(json_codec.dumps_line(dict(zip(columns, row))))
+    checksums[out_file.name] = f.hexdigest()
 
 
 def _import_jsonl(
     conn: sqlite3.Connection,
-    jsonl_path: Path,
+    pack: zipfile.ZipFile | Path,
+    name: str,
     insert_sql: str,
     fields: list[str],
 ) -> int:
-    """Import JSONL records into a table. Returns count imported."""
-    if not jsonl_path.exists():
+    """Import JSONL records into a table. Returns count imported.
+
+    Rows are inserted with executemany in batches of _IMPORT_BATCH_SIZE;
+    the caller owns the transaction.
+    """
+    f = _open_pack_entry(pack, name)
+    if f is None:
         return 0
 
     count = 0
-    with open(jsonl_path) as f:
+    batch: list[tuple] = []
+    with f:
         for line in f:
             line = line.strip()
             if not line:
                 continue
-            record = json.loads(line)
-            values = tuple(record.get(field) for field in fields)
-            conn.execute(insert_sql, values)
-            count += 1
-    conn.commit()
+            record = json_codec.loads(line)
+            batch.append(tuple(record.get(field) for field in fields))
+            if len(batch) >= _IMPORT_BATCH_SIZE:
+                conn.executemany(insert_sql, batch)
+                count += len(batch)
+                batch.clear()
+    if batch:
+        conn.executemany(insert_sql, batch)
+        count += len(batch)
     return count
 
 
+def _suspend_fts_triggers(conn: sqlite3.Connection) -> list[tuple[str, str, int]]:
+    """Drop the FTS insert triggers; return (trigger_sql, backfill_sql, max_id) each."""
+    placeholders = ",".join("?" for _ in _FTS_INSERT_TRIGGERS)
+    rows = conn.execute(
+        f"SELECT name, sql FROM sqlite_master WHERE type = 'trigger' AND name IN ({placeholders})",
+        list(_FTS_INSERT_TRIGGERS),
+    ).fetchall()
+    suspended = []
+    for name, trigger_sql in rows:
+        table, backfill_sql = _FTS_INSERT_TRIGGERS[name]
+        max_id = conn.execute(f"SELECT COALESCE(MAX(id), 0) FROM {table}").fetchone()[0]
+        conn.execute(f"DROP TRIGGER {name}")
+        suspended.append((trigger_sql, backfill_sql, max_id))
+    return suspended
+
+
+def _resume_fts_triggers(conn: sqlite3.Connection, suspended: list[tuple[str, str, int]]) -> None:
+    """Index the imported rows in bulk, then recreate the dropped triggers."""
+    for trigger_sql, backfill_sql, max_id in suspended:
+        conn.execute(backfill_sql, (max_id,))
+        conn.execute(trigger_sql)
+
+
+def _apply_pragmas(conn: sqlite3.Connection, pragmas: dict[str, Any]) -> dict[str, Any]:
+    """Set PRAGMAs and return their previous values (for restoring)."""
+    previous = {}
+    for name, value in pragmas.items():
+        previous[name] = conn.execute(f"PRAGMA {name}").fetchone()[0]
+        conn.execute(f"PRAGMA {name}={value}")
+    return previous
+
+
 def _count(conn: sqlite3.Connection, table: str, where: str, params: list[str]) -> int:
     """Count rows in a table with optional filter."""
     row = conn.execute(f"SELECT COUNT(*) FROM {table}{where}", params).fetchone()
     return row[0]
 
 
-def _sha256_file(path: Path) -> str:
-    """Compute SHA-256 hash of a file."""
-    h = hashlib.sha256()
-    with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
-    return h.hexdigest()
+def _open_pack_entry(pack: zipfile.ZipFile | Path, name: str) -> IO[bytes] | None:
+    """Open a pack member for binary reading, or None if it is absent."""
+    if isinstance(pack, zipfile.ZipFile):
+        try:
+            return pack.open(name)
+        except KeyError:
+            return None
+    fpath = pack / name
+    return open(fpath, "rb") if fpath.exists() else None
+
+
+def _has_pack_entry(pack: zipfile.ZipFile | Path, name: str) -> bool:
+    """Check whether a pack member exists."""
+    if isinstance(pack, zipfile.ZipFile):
+        try:
+            pack.getinfo(name)
+        except KeyError:
+            return False
+        return True
+    return (pack / name).exists()
+
+
+def _verify_checksums(pack: zipfile.ZipFile | Path, checksums: dict[str, str]) -> None:
+    """Hash the pack's files concurrently; raise ValueError on any mismatch."""
+    present = [name for name in checksums if _has_pack_entry(pack, name)]
+    if not present:
+        return
+    with ThreadPoolExecutor(max_workers=min(8, len(present))) as pool:
+        digests = pool.map(lambda name: _sha256_entry(pack, name), present)
+        for filename, digest in zip(present, digests):
+            if digest != checksums[filename]:
+                raise ValueError(f"Checksum mismatch for {filename}")
+
+
+def _sha256_entry(pack: zipfile.ZipFile | Path, name: str) -> str:
+    """Compute SHA-256 hash of a pack member."""
+    with _open_pack_entry(pack, name) as f:
+        if sys.version_info >= (3, 11):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
+        buf = bytearray(_HASH_BLOCK_SIZE)
+        view = memoryview(buf)
+        while n := f.readinto(buf):
+            h.update(view[:n])
+        return h.hexdigest()
@@ -8,9 +8,33 @@ before it reaches the database. Configurable via policy denylist.
 from __future__ import annotations
 
 import re
+from functools import lru_cache
+
+try:
+    import re2
+except ImportError:
+    re2 = None
 
 PLACEHOLDER = "[REDACTED]"
 
+
+def _compile(pattern: str, flags: int = 0) -> re.Pattern:
+    """Compile with google-re2 (linear-time matching) when installed, else re.
+
+    RE2 has no backreferences or look-around; patterns it rejects are
+    compiled with re instead. RE2's \\b and \\s are ASCII-only, so matches
+    next to non-ASCII text can differ slightly from re.
+    """
+    if re2 is not None:
+        options = re2.Options()
+        options.log_errors = False
+        options.case_sensitive = not flags & re.IGNORECASE
+        try:
+            return re2.compile(pattern, options)
+        except re2.error:
+            pass
+    return re.compile(pattern, flags)
+
 # Built-in patterns (always applied)
 _BUILTIN_PATTERNS: list[re.Pattern] = [
     # Authorization headers
@@ -29,15 +53,54 @@ _BUILTIN_PATTERNS: list[re.Pattern] = [
 ]
 
 
-def _compile_denylist(denylist: list[str]) -> list[re.Pattern]:
-    """Compile user-provided regex strings into patterns."""
-    compiled = []
+# Every built-in pattern needs one of these substrings (compared casefolded,
+# which also folds the Unicode characters re.IGNORECASE treats as k or s).
+# None contains "i", whose IGNORECASE matches (U+0130, U+0131) don't casefold
+# to "i". Text without any of them skips the built-in passes entirely.
+_BUILTIN_TRIGGERS = (
+    "author", "bearer", "key", "secret", "sk-", "code=", "token", "password", "credent",
+)
+
+_BACKREF_RE = re.compile(r"\\[1-9]|\(\?P=")
+
+
+# (matcher, keeps a prefix group) per built-in, on the engine picked by _compile
+_BUILTIN_MATCHERS = [(_compile(p.pattern, p.flags), bool(p.groups)) for p in _BUILTIN_PATTERNS]
+
+
+@lru_cache(maxsize=32)
+def _valid_denylist(denylist: tuple[str, ...]) -> tuple[str, ...]:
+    """User-provided regex strings that compile (as Python re patterns)."""
+    valid = []
     for pattern_str in denylist:
         try:
-            compiled.append(re.compile(pattern_str, re.IGNORECASE))
+            re.compile(pattern_str, re.IGNORECASE)
         except re.error:
             continue  # Skip invalid patterns silently
-    return compiled
+        valid.append(pattern_str)
+    return tuple(valid)
+
+
+@lru_cache(maxsize=32)
+def _compile_denylist(denylist: tuple[str, ...]) -> tuple[re.Pattern, ...]:
+    """Compile user-provided regex strings into patterns (cached per denylist)."""
+    return tuple(_compile(p, re.IGNORECASE) for p in _valid_denylist(denylist))
+
+
+@lru_cache(maxsize=32)
+def _denylist_union(denylist: tuple[str, ...]) -> re.Pattern | None:
+    """One alternation of the valid denylist patterns, or None if they can't be fused.
+
+    Patterns with backreferences (group numbers shift in a union) or that
+    fail to combine (e.g. inline global flags) are not fused.
+    """
+    patterns = _valid_denylist(denylist)
+    if not patterns or any(_BACKREF_RE.search(p) for p in patterns):
+        return None
+    try:
+        return _compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+    except re.error:
+        return None
 
 
 def redact(text: str, denylist: list[str] | None = None) -> str:
@@ -56,16 +119,21 @@ def redact(text: str, denylist: list[str] | None = None) -> str:
     result = text
 
     # Apply built-in patterns
-    for pattern in _BUILTIN_PATTERNS:
-        # For patterns with capture groups, keep the prefix and redact the value
-        if pattern.groups:
-            result = pattern.sub(lambda m: m.group(0)[:len(m.group(1))] + PLACEHOLDER, result)
-        else:
-            result = pattern.sub(PLACEHOLDER, result)
-
-    # Apply user denylist patterns
+    folded = text.casefold()
+    if any(trigger in folded for trigger in _BUILTIN_TRIGGERS):
+        for pattern, has_prefix in _BUILTIN_MATCHERS:
+            # For patterns with capture groups, keep the prefix and redact the value
+            if has_prefix:
+                result = pattern.sub(lambda m: m.group(0)[:len(m.group(1))] + PLACEHOLDER, result)
+            else:
+                result = pattern.sub(PLACEHOLDER, result)
+
+    # Apply user denylist patterns; one fused scan decides whether any can match
     if denylist:
-        for pattern in _compile_denylist(denylist):
-            result = pattern.sub(PLACEHOLDER, result)
+        key = tuple(denylist)
+        union = _denylist_union(key)
+        if union is None or union.search(result):
+            for pattern in _compile_denylist(key):
+                result = pattern.sub(PLACEHOLDER, result)
 
     return result
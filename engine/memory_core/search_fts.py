@@ -1,15 +1,28 @@
 """
-search_fts.py — Full-text search with FTS5 and LIKE fallback.
+search_fts.py — Full-text search with FTS5/FTS4 and substring fallback.
 
-Provides unified search interface regardless of FTS5 availability.
+Provides unified search interface regardless of FTS availability.
 """
 
 from __future__ import annotations
 
+import re
 import sqlite3
 
 from .models import Fact, Message
-from .store_sqlite import _row_to_fact, _row_to_message
+from .store_sqlite import _row_to_fact, _row_to_message, fts_module as _fts_module
+
+# Query sanitising: syntax characters dropped in one translate() pass;
+# bare operator words removed (words merely containing them are kept).
+_FTS_STRIP = str.maketrans("", "", '"*()')
+_FTS_OPERATOR_RE = re.compile(r"\b(?:AND|OR|NOT)\b")
+
+# Explicit projections: rows only need the columns the converters read.
+_MESSAGE_COLUMNS = "m.id, m.session_id, m.namespace, m.role, m.content, m.ts, m.metadata_json"
+_FACT_COLUMNS = (
+    "f.id, f.session_id, f.namespace, f.fact_text, f.ts, "
+    "f.importance, f.tags_json, f.supersedes_id"
+)
 
 
 def search_messages(
@@ -19,10 +32,18 @@ def search_messages(
     query: str,
     limit: int = 20,
     use_fts: bool = True,
+    fts_module: str | None = None,
 ) -> list[Message]:
-    """Search messages by content. Uses FTS5 if available, falls back to LIKE."""
-    if use_fts and _has_fts_table(conn, "messages_fts"):
-        return _fts_search_messages(conn, session_id, namespace, query, limit)
+    """Search messages by content. Uses FTS if available, falls back to instr().
+
+    Pass the module returned by ensure_fts as fts_module to skip the
+    per-query sqlite_master probe.
+    """
+    module = (fts_module or _fts_module(conn, "messages_fts")) if use_fts else None
+    if module:
+        return _fts_search_messages(
+            conn, session_id, namespace, query, limit, ranked=module == "fts5",
+        )
     return _like_search_messages(conn, session_id, namespace, query, limit)
 
 
@@ -33,14 +54,18 @@ def search_facts(
     query: str,
     limit: int = 20,
     use_fts: bool = True,
+    fts_module: str | None = None,
 ) -> list[Fact]:
-    """Search facts by text. Uses FTS5 if available, falls back to LIKE."""
-    if use_fts and _has_fts_table(conn, "facts_fts"):
-        return _fts_search_facts(conn, session_id, namespace, query, limit)
+    """Search facts by text. Uses FTS if available, falls back to instr()."""
+    module = (fts_module or _fts_module(conn, "facts_fts")) if use_fts else None
+    if module:
+        return _fts_search_facts(
+            conn, session_id, namespace, query, limit, ranked=module == "fts5",
+        )
     return _like_search_facts(conn, session_id, namespace, query, limit)
 
 
-# ── FTS5 search ──
+# ── FTS search ──
 
 def _fts_search_messages(
     conn: sqlite3.Connection,
@@ -48,15 +73,17 @@ def _fts_search_messages(
     namespace: str,
     query: str,
     limit: int,
+    ranked: bool = True,
 ) -> list[Message]:
-    """Search messages using FTS5."""
+    """Search messages using FTS (FTS4 has no rank; newest first)."""
     # Escape FTS5 special characters
     safe_query = _escape_fts_query(query)
+    order = "fts.rank" if ranked else "m.id DESC"
     rows = conn.execute(
-        "SELECT m.* FROM messages m "
-        "JOIN messages_fts fts ON m.id = fts.rowid "
-        "WHERE fts.content MATCH ? AND m.session_id = ? AND m.namespace = ? "
-        "ORDER BY fts.rank LIMIT ?",
+        f"SELECT {_MESSAGE_COLUMNS} FROM messages_fts fts "
+        "JOIN messages m ON m.id = fts.rowid "
+        "WHERE messages_fts MATCH ? AND m.session_id = ? AND m.namespace = ? "
+        f"ORDER BY {order} LIMIT ?",
         (safe_query, session_id, namespace, limit),
     ).fetchall()
     return [_row_to_message(r) for r in rows]
@@ -68,21 +95,23 @@ def _fts_search_facts(
     namespace: str,
     query: str,
     limit: int,
+    ranked: bool = True,
 ) -> list[Fact]:
-    """Search facts using FTS5."""
+    """Search facts using FTS (FTS4 has no rank; by importance instead)."""
     safe_query = _escape_fts_query(query)
+    order = "fts.rank" if ranked else "f.importance DESC, f.id DESC"
     rows = conn.execute(
-        "SELECT f.* FROM facts f "
-        "JOIN facts_fts fts ON f.id = fts.rowid "
-        "WHERE fts.fact_text MATCH ? AND f.session_id = ? AND f.namespace = ? "
+        f"SELECT {_FACT_COLUMNS} FROM facts_fts fts "
+        "JOIN facts f ON f.id = fts.rowid "
+        "WHERE facts_fts MATCH ? AND f.session_id = ? AND f.namespace = ? "
         "AND f.supersedes_id IS NULL "
-        "ORDER BY fts.rank LIMIT ?",
+        f"ORDER BY {order} LIMIT ?",
         (safe_query, session_id, namespace, limit),
     ).fetchall()
     return [_row_to_fact(r) for r in rows]
 
 
-# ── LIKE fallback ──
+# ── Substring fallback ──
 
 def _like_search_messages(
     conn: sqlite3.Connection,
@@ -91,13 +120,12 @@ def _like_search_messages(
     query: str,
     limit: int,
 ) -> list[Message]:
-    """Search messages using LIKE (fallback when FTS5 unavailable)."""
-    pattern = f"%{query}%"
+    """Case-insensitive substring search (fallback when FTS unavailable)."""
     rows = conn.execute(
         "SELECT * FROM messages "
-        "WHERE session_id = ? AND namespace = ? AND content LIKE ? "
+        "WHERE session_id = ? AND namespace = ? AND instr(lower(content), lower(?)) > 0 "
         "ORDER BY id DESC LIMIT ?",
-        (session_id, namespace, pattern, limit),
+        (session_id, namespace, query, limit),
     ).fetchall()
     return [_row_to_message(r) for r in rows]
 
@@ -109,36 +137,25 @@ def _like_search_facts(
     query: str,
     limit: int,
 ) -> list[Fact]:
-    """Search facts using LIKE (fallback when FTS5 unavailable)."""
-    pattern = f"%{query}%"
+    """Case-insensitive substring search (fallback when FTS unavailable)."""
     rows = conn.execute(
         "SELECT * FROM facts "
-        "WHERE session_id = ? AND namespace = ? AND fact_text LIKE ? "
+        "WHERE session_id = ? AND namespace = ? AND instr(lower(fact_text), lower(?)) > 0 "
         "AND supersedes_id IS NULL "
         "ORDER BY importance DESC, id DESC LIMIT ?",
-        (session_id, namespace, pattern, limit),
+        (session_id, namespace, query, limit),
     ).fetchall()
     return [_row_to_fact(r) for r in rows]
 
 
 # ── Helpers ──
 
-def _has_fts_table(conn: sqlite3.Connection, table_name: str) -> bool:
-    """Check if an FTS virtual table exists."""
-    row = conn.execute(
-        "SELECT name FROM sqlite_master WHERE type='table' AND name=?",
-        (table_name,),
-    ).fetchone()
-    return row is not None
-
-
 def _escape_fts_query(query: str) -> str:
     """Escape special FTS5 characters and wrap terms for prefix matching."""
     # Remove FTS5 operators that could cause syntax errors
-    cleaned = query.replace('"', "").replace("*", "").replace("(", "").replace(")", "")
-    cleaned = cleaned.replace("AND", "").replace("OR", "").replace("NOT", "")
+    cleaned = _FTS_OPERATOR_RE.sub("", query.translate(_FTS_STRIP))
     terms = cleaned.split()
     if not terms:
         return '""'
     # Quote each term for exact matching
-    return " ".join(f'"{t}"' for t in terms if t.strip())
+    return " ".join(f'"{t}"' for t in terms)
@@ -13,6 +13,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from . import json_codec
 from .models import Fact, Message, Summary
 
 SCHEMA_SQL = """
@@ -60,10 +61,50 @@ CREATE TABLE IF NOT EXISTS meta (
 
 CREATE INDEX IF NOT EXISTS idx_messages_session_ns ON messages(session_id, namespace);
 CREATE INDEX IF NOT EXISTS idx_messages_ts ON messages(ts);
-CREATE INDEX IF NOT EXISTS idx_facts_session_ns ON facts(session_id, namespace);
+-- Active facts in (importance, id) order straight from the index; id is the
+-- rowid, so scanning it backwards yields importance DESC, id DESC.
+DROP INDEX IF EXISTS idx_facts_session_ns;
+CREATE INDEX IF NOT EXISTS idx_facts_active ON facts(session_id, namespace, supersedes_id, importance);
 CREATE INDEX IF NOT EXISTS idx_summaries_session_ns ON summaries(session_id, namespace);
 """
 
+# Hot-path statements, kept as constants so every call hits the same
+# entry in the connection's statement cache.
+_SQL_INSERT_MESSAGE = (
+    "INSERT INTO messages (session_id, namespace, role, content, ts, metadata_json) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+_SQL_INSERT_FACT = (
+    "INSERT INTO facts (session_id, namespace, fact_text, ts, importance, tags_json, supersedes_id) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+# Summaries can repeat per scope (pack imports append), so upserts target
+# the newest row, matching get_summary.
+_SQL_SELECT_SUMMARY_ID = (
+    "SELECT id FROM summaries WHERE session_id = ? AND namespace = ? AND scope = ? "
+    "ORDER BY id DESC LIMIT 1"
+)
+_SQL_UPDATE_SUMMARY = "UPDATE summaries SET summary_text = ?, ts = ? WHERE id = ?"
+_SQL_UPDATE_LATEST_SUMMARY = (
+    "UPDATE summaries SET summary_text = ?, ts = ? "
+    f"WHERE id = ({_SQL_SELECT_SUMMARY_ID}) RETURNING id"
+)
+_SQL_INSERT_SUMMARY = (
+    "INSERT INTO summaries (session_id, namespace, summary_text, ts, scope) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+# UPDATE ... RETURNING needs SQLite 3.35+.
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+_SQL_INSERT_EVENT = "INSERT INTO events (ts, type, payload_json) VALUES (?, ?, ?)"
+_SQL_SET_META = "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)"
+
+# sqlite3's default statement cache holds 128 entries.
+_CACHED_STATEMENTS = 256
+
+# Large deletes commit every _DELETE_CHUNK_SIZE rows so the WAL stays
+# bounded and readers are not blocked behind one long write transaction.
+_DELETE_CHUNK_SIZE = 5000
+
 
 def _now() -> str:
     return datetime.now(timezone.utc).isoformat()
@@ -79,7 +120,7 @@ def get_db_path(project_root: Path, db_path: Path | str | None = None) -> Path:
 def connect(db_path: Path) -> sqlite3.Connection:
     """Open or create the memory database."""
     db_path.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(db_path))
+    conn = sqlite3.connect(str(db_path), cached_statements=_CACHED_STATEMENTS)
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA journal_mode=WAL")
     conn.executescript(SCHEMA_SQL)
@@ -97,10 +138,26 @@ def detect_fts5(conn: sqlite3.Connection) -> bool:
         return False
 
 
-def ensure_fts(conn: sqlite3.Connection) -> bool:
-    """Create FTS5 virtual tables if supported. Returns True if FTS5 is active."""
+def fts_module(conn: sqlite3.Connection, table_name: str) -> str | None:
+    """Return "fts5" or "fts4" for an FTS virtual table, None if absent."""
+    row = conn.execute(
+        "SELECT sql FROM sqlite_master WHERE type='table' AND name=?",
+        (table_name,),
+    ).fetchone()
+    if row is None:
+        return None
+    return "fts5" if "fts5" in row[0].lower() else "fts4"
+
+
+def ensure_fts(conn: sqlite3.Connection) -> str | None:
+    """Create FTS virtual tables if supported.
+
+    Prefers FTS5; builds without it fall back to FTS4, which SQLite ships
+    in essentially every build. Returns the module backing messages_fts
+    ("fts5" or "fts4"), or None if full-text search is unavailable.
+    """
     if not detect_fts5(conn):
-        return False
+        return fts_module(conn, "messages_fts") if _ensure_fts4(conn) else None
 
     fts_sql = """
     CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts
@@ -132,6 +189,45 @@ def ensure_fts(conn: sqlite3.Connection) -> bool:
     """
     conn.executescript(trigger_sql)
     conn.commit()
+    return fts_module(conn, "messages_fts")
+
+
+def _ensure_fts4(conn: sqlite3.Connection) -> bool:
+    """Create FTS4 external-content tables. Returns False if FTS4 is missing."""
+    fts_sql = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts
+        USING fts4(content, content="messages");
+
+    CREATE VIRTUAL TABLE IF NOT EXISTS facts_fts
+        USING fts4(fact_text, content="facts");
+    """
+    try:
+        conn.executescript(fts_sql)
+    except sqlite3.OperationalError:
+        return False
+    conn.commit()
+
+    # FTS4 reads the old values from the content table, so deletes must
+    # be mirrored before the row goes away.
+    trigger_sql = """
+    CREATE TRIGGER IF NOT EXISTS messages_ai AFTER INSERT ON messages BEGIN
+        INSERT INTO messages_fts(docid, content) VALUES (new.id, new.content);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS messages_bd BEFORE DELETE ON messages BEGIN
+        DELETE FROM messages_fts WHERE docid = old.id;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS facts_ai AFTER INSERT ON facts BEGIN
+        INSERT INTO facts_fts(docid, fact_text) VALUES (new.id, new.fact_text);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS facts_bd BEFORE DELETE ON facts BEGIN
+        DELETE FROM facts_fts WHERE docid = old.id;
+    END;
+    """
+    conn.executescript(trigger_sql)
+    conn.commit()
     return True
 
 
@@ -147,10 +243,9 @@ def insert_message(
 ) -> int:
     """Insert a message and return its row id."""
     cur = conn.execute(
-        "INSERT INTO messages (session_id, namespace, role, content, ts, metadata_json) "
-        "VALUES (?, ?, ?, ?, ?, ?)",
+        _SQL_INSERT_MESSAGE,
         (session_id, namespace, role, content, _now(),
-         json.dumps(metadata) if metadata else None),
+         json_codec.dumps(metadata) if metadata else None),
     )
     conn.commit()
     return cur.lastrowid  # type: ignore[return-value]
@@ -198,10 +293,9 @@ def insert_fact(
 ) -> int:
     """Insert a fact and return its row id."""
     cur = conn.execute(
-        "INSERT INTO facts (session_id, namespace, fact_text, ts, importance, tags_json, supersedes_id) "
-        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+        _SQL_INSERT_FACT,
         (session_id, namespace, fact_text, _now(), importance,
-         json.dumps(tags) if tags else None, supersedes_id),
+         json_codec.dumps(tags) if tags else None, supersedes_id),
     )
     conn.commit()
     return cur.lastrowid  # type: ignore[return-value]
@@ -239,12 +333,11 @@ def get_fact_count(
 
 def delete_superseded_facts(conn: sqlite3.Connection, session_id: str, namespace: str) -> int:
     """Remove facts that have been superseded. Returns count deleted."""
-    cur = conn.execute(
-        "DELETE FROM facts WHERE session_id = ? AND namespace = ? AND supersedes_id IS NOT NULL",
-        (session_id, namespace),
+    return _delete_in_chunks(
+        conn, "facts",
+        "session_id = ? AND namespace = ? AND supersedes_id IS NOT NULL",
+        [session_id, namespace],
     )
-    conn.commit()
-    return cur.rowcount
 
 
 # ── Summaries ──
@@ -257,27 +350,27 @@ def upsert_summary(
     scope: str = "rolling",
 ) -> int:
     """Insert or replace the summary for a session/namespace/scope."""
-    # Check for existing
-    existing = conn.execute(
-        "SELECT id FROM summaries WHERE session_id = ? AND namespace = ? AND scope = ?",
-        (session_id, namespace, scope),
-    ).fetchone()
+    now = _now()
+    if _HAS_RETURNING:
+        row = conn.execute(
+            _SQL_UPDATE_LATEST_SUMMARY,
+            (summary_text, now, session_id, namespace, scope),
+        ).fetchone()
+    else:
+        row = conn.execute(_SQL_SELECT_SUMMARY_ID, (session_id, namespace, scope)).fetchone()
+        if row:
+            conn.execute(_SQL_UPDATE_SUMMARY, (summary_text, now, row["id"]))
 
-    if existing:
-        conn.execute(
-            "UPDATE summaries SET summary_text = ?, ts = ? WHERE id = ?",
-            (summary_text, _now(), existing["id"]),
-        )
-        conn.commit()
-        return existing["id"]
+    if row:
+        summary_id = row["id"]
     else:
         cur = conn.execute(
-            "INSERT INTO summaries (session_id, namespace, summary_text, ts, scope) "
-            "VALUES (?, ?, ?, ?, ?)",
-            (session_id, namespace, summary_text, _now(), scope),
+            _SQL_INSERT_SUMMARY,
+            (session_id, namespace, summary_text, now, scope),
         )
-        conn.commit()
-        return cur.lastrowid  # type: ignore[return-value]
+        summary_id = cur.lastrowid
+    conn.commit()
+    return summary_id  # type: ignore[return-value]
 
 
 def get_summary(
@@ -300,8 +393,8 @@ def get_summary(
 def add_event(conn: sqlite3.Connection, event_type: str, payload: dict | None = None):
     """Log an internal memory event."""
     conn.execute(
-        "INSERT INTO events (ts, type, payload_json) VALUES (?, ?, ?)",
-        (_now(), event_type, json.dumps(payload) if payload else None),
+        _SQL_INSERT_EVENT,
+        (_now(), event_type, json_codec.dumps(payload) if payload else None),
     )
     conn.commit()
 
@@ -314,7 +407,7 @@ def get_meta(conn: sqlite3.Connection, key: str) -> str | None:
 
 
 def set_meta(conn: sqlite3.Connection, key: str, value: str):
-    conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+    conn.execute(_SQL_SET_META, (key, value))
     conn.commit()
 
 
@@ -337,9 +430,7 @@ def purge_messages(
         params.append(older_than_iso)
 
     where = " AND ".join(conditions) if conditions else "1=1"
-    cur = conn.execute(f"DELETE FROM messages WHERE {where}", params)
-    conn.commit()
-    return cur.rowcount
+    return _delete_in_chunks(conn, "messages", where, params)
 
 
 def purge_facts(
@@ -359,9 +450,7 @@ def purge_facts(
         params.append(older_than_iso)
 
     where = " AND ".join(conditions) if conditions else "1=1"
-    cur = conn.execute(f"DELETE FROM facts WHERE {where}", params)
-    conn.commit()
-    return cur.rowcount
+    return _delete_in_chunks(conn, "facts", where, params)
 
 
 def purge_summaries(
@@ -377,13 +466,33 @@ def purge_summaries(
     return cur.rowcount
 
 
+def _delete_in_chunks(
+    conn: sqlite3.Connection,
+    table: str,
+    where: str,
+    params: list[str],
+) -> int:
+    """Delete matching rows, committing per chunk. Returns count deleted."""
+    sql = (
+        f"DELETE FROM {table} WHERE id IN "
+        f"(SELECT id FROM {table} WHERE {where} LIMIT {_DELETE_CHUNK_SIZE})"
+    )
+    total = 0
+    while True:
+        cur = conn.execute(sql, params)
+        conn.commit()
+        total += cur.rowcount
+        if cur.rowcount < _DELETE_CHUNK_SIZE:
+            return total
+
+
 # ── Row converters ──
 
 def _row_to_message(row: sqlite3.Row) -> Message:
     meta = None
     if row["metadata_json"]:
         try:
-            meta = json.loads(row["metadata_json"])
+            meta = json_codec.loads(row["metadata_json"])
         except (json.JSONDecodeError, TypeError):
             pass
     return Message(
@@ -401,7 +510,7 @@ def _row_to_fact(row: sqlite3.Row) -> Fact:
     tags = []
     if row["tags_json"]:
         try:
-            tags = json.loads(row["tags_json"])
+            tags = json_codec.loads(row["tags_json"])
         except (json.JSONDecodeError, TypeError):
             pass
     return Fact(
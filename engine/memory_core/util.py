@@ -9,6 +9,9 @@ from __future__ import annotations
 
 from .models import Message
 
+# Display names for the common roles; anything else is capitalized on the fly
+_ROLE_CAP = {"user": "User", "assistant": "Assistant", "system": "System", "tool": "Tool"}
+
 
 def build_distill_facts_prompt(messages: list[Message]) -> str:
     """Build a prompt asking an LLM to extract key facts from messages.
@@ -85,8 +88,7 @@ Summary:"""
 
 def _format_messages(messages: list[Message]) -> str:
     """Format a list of messages into a readable conversation string."""
-    lines = []
-    for msg in messages:
-        role = msg.role.capitalize()
-        lines.append(f"[{role}]: {msg.content}")
-    return "\n".join(lines)
+    return "\n".join(
+        f"[{_ROLE_CAP.get(msg.role) or msg.role.capitalize()}]: {msg.content}"
+        for msg in messages
+    )
@@ -9,6 +9,7 @@ provides all data.
 from __future__ import annotations
 
 import re
+from collections import deque
 from datetime import datetime, timezone
 
 from .model import (
@@ -20,6 +21,15 @@ from .model import (
     ReportTask,
 )
 
+# Matches "## YYYY-MM-DD: Title" headings in DECISIONS.md
+_DECISION_HEADING_RE = re.compile(r"^##\s+(\d{4}-\d{2}-\d{2}):\s*(.+)$", re.MULTILINE)
+
+# Next-action sort rank: high priority first, everything else after it
+_PRIORITY_RANK = {"high": 0}
+
+# Task status -> milestone status; anything else is "pending"
+_MILESTONE_STATUS_MAP = {"done": "done", "in_progress": "in_progress"}
+
 
 def generate_report(adapter_data: dict) -> ProjectReport:
     """Build a ProjectReport from adapter-provided data.
@@ -40,29 +50,56 @@ def generate_report(adapter_data: dict) -> ProjectReport:
     columns = board.get("columns", ["backlog", "ready", "in_progress", "review", "done"])
     raw_tasks = board.get("tasks", [])
 
+    # One pass builds the tasks and every per-status bucket and health
+    # tally the sections below need.
     tasks: list[ReportTask] = []
-    for t in raw_tasks:
-        tasks.append(ReportTask(
-            id=t.get("id", "?"),
-            title=t.get("title", "Untitled"),
-            status=t.get("status", "backlog"),
-            progress=t.get("progress"),
-            priority=t.get("priority"),
-            owner=t.get("owner"),
-            owner_role=t.get("owner_role"),
-            dependencies=t.get("dependencies", []),
-            blocker_reason=t.get("blocker_reason"),
-            requires_approval=t.get("requires_approval", []),
-            last_update=t.get("last_update"),
-            artifacts=t.get("artifacts", []),
-        ))
+    by_status: dict[str, list[ReportTask]] = {}
+    assignments: dict[str, list[str]] = {}
+    blockers = []
+    blocked_tasks: list[ReportTask] = []
+    no_owner = no_priority = no_update = high_backlog = 0
+    for raw in raw_tasks:
+        t = ReportTask(
+            id=raw.get("id", "?"),
+            title=raw.get("title", "Untitled"),
+            status=raw.get("status", "backlog"),
+            progress=raw.get("progress"),
+            priority=raw.get("priority"),
+            owner=raw.get("owner"),
+            owner_role=raw.get("owner_role"),
+            dependencies=raw.get("dependencies", []),
+            blocker_reason=raw.get("blocker_reason"),
+            requires_approval=raw.get("requires_approval", []),
+            last_update=raw.get("last_update"),
+            artifacts=raw.get("artifacts", []),
+        )
+        tasks.append(t)
+        status = t.status
+        by_status.setdefault(status, []).append(t)
 
-    # --- Counts ---
-    task_counts = {col: 0 for col in columns}
-    for t in tasks:
-        if t.status in task_counts:
-            task_counts[t.status] += 1
+        if t.blocker_reason:
+            blocked_tasks.append(t)
+            blockers.append(f"{t.id}: {t.blocker_reason}")
+        if status == "done":
+            continue
+        if t.requires_approval:
+            blockers.append(f"{t.id}: requires approval ({', '.join(t.requires_approval)})")
 
+        # Map owner_role → task IDs
+        role = t.owner_role or t.owner
+        assignments.setdefault(role or "Unassigned", []).append(t.id)
+
+        if not role:
+            no_owner += 1
+        if not t.priority:
+            no_priority += 1
+        if status == "in_progress" and not t.last_update:
+            no_update += 1
+        elif status == "backlog" and t.priority == "high":
+            high_backlog += 1
+
+    # --- Counts ---
+    task_counts = {col: len(by_status.get(col, ())) for col in columns}
     total = len(tasks)
     done_count = task_counts.get("done", 0)
     overall_progress = int(done_count / total * 100) if total > 0 else 0
@@ -72,9 +109,9 @@ def generate_report(adapter_data: dict) -> ProjectReport:
         phase = "Initialization"
     elif done_count == total:
         phase = "Complete"
-    elif any(t.status == "in_progress" for t in tasks):
+    elif "in_progress" in by_status:
         phase = "Active Development"
-    elif any(t.status == "ready" for t in tasks):
+    elif "ready" in by_status:
         phase = "Planning"
     else:
         phase = "Backlog"
@@ -92,28 +129,6 @@ def generate_report(adapter_data: dict) -> ProjectReport:
     if backlog > 0:
         summary.append(f"{backlog} task(s) in backlog")
 
-    # --- Assignments ---
-    team = adapter_data.get("team", {})
-    assignments: dict[str, list[str]] = {}
-
-    # Map owner_role → task IDs
-    for t in tasks:
-        if t.status == "done":
-            continue
-        role = t.owner_role or t.owner
-        if role:
-            assignments.setdefault(role, []).append(t.id)
-        else:
-            assignments.setdefault("Unassigned", []).append(t.id)
-
-    # --- Blockers ---
-    blockers = []
-    for t in tasks:
-        if t.blocker_reason:
-            blockers.append(f"{t.id}: {t.blocker_reason}")
-        if t.requires_approval and t.status not in ("done",):
-            blockers.append(f"{t.id}: requires approval ({', '.join(t.requires_approval)})")
-
     # --- Approvals ---
     approvals_data = adapter_data.get("approvals", {})
     approval_log = approvals_data.get("approval_log", [])
@@ -137,31 +152,28 @@ def generate_report(adapter_data: dict) -> ProjectReport:
 
     # --- Next actions ---
     next_actions = []
-    ready_tasks = [t for t in tasks if t.status == "ready"]
-    for t in sorted(ready_tasks, key=lambda x: (x.priority != "high", x.id)):
+    ready_tasks = by_status.get("ready", [])
+    for t in sorted(ready_tasks, key=_next_action_key):
         next_actions.append(f"[{t.id}] {t.title}")
     if not next_actions:
-        backlog_tasks = [t for t in tasks if t.status == "backlog"]
-        for t in sorted(backlog_tasks, key=lambda x: (x.priority != "high", x.id))[:3]:
+        backlog_tasks = by_status.get("backlog", [])
+        for t in sorted(backlog_tasks, key=_next_action_key)[:3]:
             next_actions.append(f"[{t.id}] {t.title} (needs triage)")
 
     # --- Data health ---
     data_health = DataHealth()
     warnings = []
-    no_owner = [t for t in tasks if t.status != "done" and not t.owner and not t.owner_role]
-    data_health.missing_owners = len(no_owner)
+    data_health.missing_owners = no_owner
     if no_owner:
-        warnings.append(f"{len(no_owner)} active task(s) have no owner assigned")
+        warnings.append(f"{no_owner} active task(s) have no owner assigned")
 
-    no_priority = [t for t in tasks if t.status != "done" and not t.priority]
-    data_health.tasks_without_priority = len(no_priority)
+    data_health.tasks_without_priority = no_priority
     if no_priority:
-        warnings.append(f"{len(no_priority)} active task(s) have no priority set")
+        warnings.append(f"{no_priority} active task(s) have no priority set")
 
-    no_update = [t for t in tasks if t.status == "in_progress" and not t.last_update]
-    data_health.stale_tasks = len(no_update)
+    data_health.stale_tasks = no_update
     if no_update:
-        warnings.append(f"{len(no_update)} in-progress task(s) have no last_update timestamp")
+        warnings.append(f"{no_update} in-progress task(s) have no last_update timestamp")
 
     data_health.warnings = warnings
 
@@ -169,9 +181,8 @@ def generate_report(adapter_data: dict) -> ProjectReport:
     risks = []
     if data_health.missing_owners > 0:
         risks.append("Some tasks have no assigned owner")
-    high_backlog = [t for t in tasks if t.status == "backlog" and t.priority == "high"]
-    if len(high_backlog) > 3:
-        risks.append(f"{len(high_backlog)} high-priority tasks still in backlog")
+    if high_backlog > 3:
+        risks.append(f"{high_backlog} high-priority tasks still in backlog")
 
     return ProjectReport(
         generated_at=now,
@@ -191,49 +202,53 @@ def generate_report(adapter_data: dict) -> ProjectReport:
         data_health=data_health,
         task_counts=task_counts,
         columns=columns,
+        tasks_by_status=by_status,
+        blocked_tasks=blocked_tasks,
     )
 
 
 def _parse_decisions(text: str) -> list[ReportDecision]:
     """Parse recent decisions from DECISIONS.md content."""
-    if not text:
+    if not text or "##" not in text:
+        # Substring test is far cheaper than a regex scan that finds nothing
         return []
 
-    decisions = []
-    # Match ## YYYY-MM-DD: Title patterns
-    pattern = re.compile(r"^##\s+(\d{4}-\d{2}-\d{2}):\s*(.+)$", re.MULTILINE)
-    matches = list(pattern.finditer(text))
+    # Only the last 5 headings are reported; keep just those while scanning
+    matches = deque(_DECISION_HEADING_RE.finditer(text), maxlen=5)
+    ends = [m.start() for m in matches][1:] + [len(text)]
 
-    for i, match in enumerate(matches):
+    decisions = []
+    for match, end in zip(matches, ends):
         date = match.group(1)
         title = match.group(2).strip()
 
         # Extract detail: text between this heading and the next
-        start = match.end()
-        end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
-        detail = text[start:end].strip()
+        detail = text[match.end():end].strip()
 
         # Trim to first few lines
-        detail_lines = detail.split("\n")
+        detail_lines = detail.split("\n", 5)
         if len(detail_lines) > 5:
             detail = "\n".join(detail_lines[:5]) + "\n  ..."
 
         decisions.append(ReportDecision(date=date, title=title, detail=detail))
 
-    # Return most recent 5
-    return decisions[-5:]
+    return decisions
+
+
+def _next_action_key(t: ReportTask) -> tuple[int, str]:
+    """Sort key for next actions: high priority first, then by task id."""
+    return _PRIORITY_RANK.get(t.priority, 1), t.id
 
 
 def _derive_milestones(tasks: list[ReportTask]) -> list[ReportMilestone]:
     """Derive milestones from phase-level tasks (PHASE-* prefixed)."""
     milestones = []
     for t in tasks:
-        if t.id.startswith("PHASE-") or t.id.startswith("V2-"):
-            status = "done" if t.status == "done" else "in_progress" if t.status == "in_progress" else "pending"
+        if t.id.startswith(("PHASE-", "V2-")):
             milestones.append(ReportMilestone(
                 id=t.id,
                 title=t.title,
-                status=status,
+                status=_MILESTONE_STATUS_MAP.get(t.status, "pending"),
                 tasks=[t.id],
             ))
     return milestones
@@ -8,9 +8,13 @@ from __future__ import annotations
 
 import json
 
+from .. import json_codec
 from .model import ProjectReport
 
 
 def render_json(report: ProjectReport, indent: int = 2) -> str:
     """Serialize a ProjectReport to JSON string."""
-    return json.dumps(report.to_dict(), indent=indent, ensure_ascii=False)
+    data = report.to_dict()
+    if indent == 2 and json_codec.orjson is not None:
+        return json_codec.dumps(data, indent=True)
+    return json.dumps(data, indent=indent, ensure_ascii=False)
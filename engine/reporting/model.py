@@ -7,11 +7,15 @@ Terminal and JSON renderers both consume this model.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
+import sys
+from dataclasses import dataclass, field
 from typing import Optional
 
+# Slotted instances drop the per-object __dict__ (dataclass slots need 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class ReportTask:
     id: str
     title: str
@@ -27,13 +31,23 @@ class ReportTask:
     artifacts: list[str] = field(default_factory=list)
 
     def to_dict(self) -> dict:
-        d = asdict(self)
-        if d["owner"] is None:
-            d["owner"] = "Unassigned"
-        return d
+        return {
+            "id": self.id,
+            "title": self.title,
+            "status": self.status,
+            "progress": self.progress,
+            "priority": self.priority,
+            "owner": "Unassigned" if self.owner is None else self.owner,
+            "owner_role": self.owner_role,
+            "dependencies": self.dependencies,
+            "blocker_reason": self.blocker_reason,
+            "requires_approval": self.requires_approval,
+            "last_update": self.last_update,
+            "artifacts": self.artifacts,
+        }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ReportMilestone:
     id: str
     title: str
@@ -43,20 +57,27 @@ class ReportMilestone:
     tasks: list[str] = field(default_factory=list)
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {
+            "id": self.id,
+            "title": self.title,
+            "status": self.status,
+            "target_date": self.target_date,
+            "completion_date": self.completion_date,
+            "tasks": self.tasks,
+        }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ReportDecision:
     date: str
     title: str
     detail: str
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {"date": self.date, "title": self.title, "detail": self.detail}
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ReportApproval:
     trigger_id: str
     description: str
@@ -64,10 +85,15 @@ class ReportApproval:
     status: str = "pending"
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {
+            "trigger_id": self.trigger_id,
+            "description": self.description,
+            "task_id": self.task_id,
+            "status": self.status,
+        }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DataHealth:
     missing_owners: int = 0
     stale_tasks: int = 0
@@ -75,10 +101,15 @@ class DataHealth:
     warnings: list[str] = field(default_factory=list)
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {
+            "missing_owners": self.missing_owners,
+            "stale_tasks": self.stale_tasks,
+            "tasks_without_priority": self.tasks_without_priority,
+            "warnings": self.warnings,
+        }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ProjectReport:
     generated_at: str
     project_name: str
@@ -101,6 +132,16 @@ class ProjectReport:
     task_counts: dict[str, int] = field(default_factory=dict)
     columns: list[str] = field(default_factory=list)
 
+    # Renderer indexes, derived from tasks (not serialized)
+    tasks_by_status: dict[str, list[ReportTask]] = field(default_factory=dict, repr=False)
+    blocked_tasks: list[ReportTask] = field(default_factory=list, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.tasks and not self.tasks_by_status:
+            for t in self.tasks:
+                self.tasks_by_status.setdefault(t.status, []).append(t)
+            self.blocked_tasks = [t for t in self.tasks if t.blocker_reason]
+
     def to_dict(self) -> dict:
         return {
             "generated_at": self.generated_at,
@@ -7,7 +7,9 @@ All rendering derives from the report model (which is JSON-serializable).
 
 from __future__ import annotations
 
-from .model import ProjectReport
+from collections.abc import Sequence
+
+from .model import ProjectReport, ReportTask
 
 
 def render_terminal(report: ProjectReport) -> str:
@@ -57,50 +59,14 @@ def render_terminal(report: ProjectReport) -> str:
     # ── Task Snapshot ──
     lines.append(_section("Task Snapshot"))
 
-    # Active / in-progress
-    active = [t for t in report.tasks if t.status == "in_progress"]
-    if active:
-        lines.append("  IN PROGRESS:")
-        for t in active:
-            owner = t.owner or t.owner_role or "Unassigned"
-            lines.append(f"    [{t.id}] {t.title}")
-            lines.append(f"           owner: {owner}  priority: {t.priority or '-'}")
-        lines.append("")
-
-    # Ready
-    ready = [t for t in report.tasks if t.status == "ready"]
-    if ready:
-        lines.append("  READY:")
-        for t in ready:
-            owner = t.owner or t.owner_role or "Unassigned"
-            pri = t.priority or "-"
-            lines.append(f"    [{t.id}] {t.title}")
-            lines.append(f"           owner: {owner}  priority: {pri}")
-        lines.append("")
-
-    # Backlog
-    backlog = [t for t in report.tasks if t.status == "backlog"]
-    if backlog:
-        lines.append("  BACKLOG:")
-        for t in backlog:
-            owner = t.owner or t.owner_role or "Unassigned"
-            pri = t.priority or "-"
-            lines.append(f"    [{t.id}] {t.title}")
-            lines.append(f"           owner: {owner}  priority: {pri}")
-        lines.append("")
-
-    # Review
-    review = [t for t in report.tasks if t.status == "review"]
-    if review:
-        lines.append("  IN REVIEW:")
-        for t in review:
-            owner = t.owner or t.owner_role or "Unassigned"
-            lines.append(f"    [{t.id}] {t.title}")
-            lines.append(f"           owner: {owner}  priority: {t.priority or '-'}")
-        lines.append("")
+    by_status = report.tasks_by_status
+    _render_task_group(lines, "IN PROGRESS", by_status.get("in_progress", ()))
+    _render_task_group(lines, "READY", by_status.get("ready", ()))
+    _render_task_group(lines, "BACKLOG", by_status.get("backlog", ()))
+    _render_task_group(lines, "IN REVIEW", by_status.get("review", ()))
 
     # Blocked
-    blocked = [t for t in report.tasks if t.blocker_reason]
+    blocked = report.blocked_tasks
     if blocked:
         lines.append("  BLOCKED:")
         for t in blocked:
@@ -109,7 +75,7 @@ def render_terminal(report: ProjectReport) -> str:
         lines.append("")
 
     # Done (compact)
-    done = [t for t in report.tasks if t.status == "done"]
+    done = by_status.get("done", ())
     if done:
         lines.append(f"  COMPLETED ({len(done)}):")
         for t in done:
@@ -186,6 +152,18 @@ def render_terminal(report: ProjectReport) -> str:
     return "\n".join(lines)
 
 
+def _render_task_group(lines: list[str], header: str, tasks: Sequence[ReportTask]) -> None:
+    """Append a titled task group (two lines per task); nothing if empty."""
+    if not tasks:
+        return
+    lines.append(f"  {header}:")
+    for t in tasks:
+        owner = t.owner or t.owner_role or "Unassigned"
+        lines.append(f"    [{t.id}] {t.title}")
+        lines.append(f"           owner: {owner}  priority: {t.priority or '-'}")
+    lines.append("")
+
+
 def _center(text: str, width: int) -> str:
     pad = (width - len(text)) // 2
     return " " * pad + text
@@ -41,7 +41,7 @@ def write_status_md(report: ProjectReport, ai_dir: Path):
     for col in report.columns:
         if col == "done":
             continue
-        col_tasks = [t for t in report.tasks if t.status == col]
+        col_tasks = report.tasks_by_status.get(col)
         if not col_tasks:
             continue
         lines.append(f"## {col.replace('_', ' ').title()} ({len(col_tasks)})")
@@ -52,7 +52,7 @@ def write_status_md(report: ProjectReport, ai_dir: Path):
         lines.append("")
 
     # Done
-    done_tasks = [t for t in report.tasks if t.status == "done"]
+    done_tasks = report.tasks_by_status.get("done")
     if done_tasks:
         lines.append(f"## Completed ({len(done_tasks)})")
         for t in done_tasks:
@@ -205,6 +205,7 @@ def test_export_import_roundtrip():
         # Check manifest
         manifest = json.loads((Path(pack_path) / "manifest.json").read_text())
         assert manifest["version"] == "1.0"
+        assert manifest["events_format"] == "jsonl"
         assert manifest["skeleton_version"] == "test-version"
 
         # Export as zip
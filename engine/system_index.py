@@ -10,18 +10,38 @@ changes. No writes are made to the submodule.
 from __future__ import annotations
 
 import json
+import os
+import re
 import subprocess
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
+from . import json_codec
+
 try:
     import yaml
 except ImportError:
     yaml = None  # type: ignore[assignment]
 
 
+_SHA_RE = re.compile(r"[0-9a-f]{40}(?:[0-9a-f]{24})?")
+
+# First text line of a module docstring, after any shebang/comment lines;
+# covers one-line docstrings and ones whose text starts on the next line.
+_MODULE_DOCSTRING_RE = re.compile(
+    r"\A(?:[ \t]*#[^\n]*\n|\s)*"
+    r"(?:\"\"\"|''')\s*(.*?)\s*(?:\"\"\"|'''|$)",
+    re.MULTILINE,
+)
+_DOCSTRING_PROBE_BYTES = 4096
+
+
 def _get_submodule_head(skeleton_dir: Path) -> str:
     """Return the current HEAD commit of the skeleton submodule."""
+    head = _read_head(skeleton_dir)
+    if head is not None:
+        return head
     try:
         result = subprocess.run(
             ["git", "rev-parse", "HEAD"],
@@ -37,6 +57,96 @@ def _get_submodule_head(skeleton_dir: Path) -> str:
     return "unknown"
 
 
+def _git_dir(skeleton_dir: Path) -> Path | None:
+    """Locate the skeleton's git dir (a ``.git`` directory or ``gitdir:`` file)."""
+    dot_git = skeleton_dir / ".git"
+    if dot_git.is_dir():
+        return dot_git
+    if dot_git.is_file():
+        text = dot_git.read_text().strip()
+        if text.startswith("gitdir:"):
+            return (skeleton_dir / text[len("gitdir:"):].strip()).resolve()
+    return None
+
+
+def _ref_dirs(git_dir: Path) -> list[Path]:
+    """Dirs holding refs for git_dir (linked worktrees share a common dir)."""
+    dirs = [git_dir]
+    commondir = git_dir / "commondir"
+    if commondir.is_file():
+        dirs.append((git_dir / commondir.read_text().strip()).resolve())
+    return dirs
+
+
+def _read_head(skeleton_dir: Path) -> str | None:
+    """Read HEAD straight from the git dir, following one ``ref:``.
+
+    Returns None when anything is unusual (no git dir at skeleton_dir,
+    unresolvable ref); the caller then falls back to ``git rev-parse``.
+    """
+    try:
+        git_dir = _git_dir(skeleton_dir)
+        if git_dir is None:
+            return None
+        head = (git_dir / "HEAD").read_text().strip()
+        if not head.startswith("ref:"):
+            return head if _SHA_RE.fullmatch(head) else None
+        ref = head[len("ref:"):].strip()
+
+        search = _ref_dirs(git_dir)
+        for base in search:
+            ref_file = base / ref
+            if ref_file.is_file():
+                sha = ref_file.read_text().strip()
+                return sha if _SHA_RE.fullmatch(sha) else None
+        for base in search:
+            packed = base / "packed-refs"
+            if packed.is_file():
+                for line in packed.read_text().splitlines():
+                    sha, _, name = line.partition(" ")
+                    if name == ref and _SHA_RE.fullmatch(sha):
+                        return sha
+    except OSError:
+        pass
+    return None
+
+
+def _head_stat(skeleton_dir: Path) -> dict[str, int]:
+    """mtime_ns of every path HEAD resolution reads; {} if not resolvable.
+
+    Covers HEAD, the directory holding the branch's loose ref (git
+    replaces refs by rename, so the directory mtime moves on every
+    commit, including when a packed ref first becomes loose) and
+    packed-refs. Missing paths are recorded as 0.
+    """
+    try:
+        git_dir = _git_dir(skeleton_dir)
+        if git_dir is None:
+            return {}
+        paths = [git_dir / "HEAD"]
+        head = paths[0].read_text().strip()
+        if head.startswith("ref:"):
+            ref = head[len("ref:"):].strip()
+            for base in _ref_dirs(git_dir):
+                paths += [(base / ref).parent, base / "packed-refs"]
+    except OSError:
+        return {}
+    return {str(p): _mtime_ns(p) for p in paths}
+
+
+def _mtime_ns(path: Path | str) -> int:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _head_unchanged(cached: dict) -> bool:
+    """Stat-only check that the paths behind the cached HEAD are untouched."""
+    stat = cached.get("skeleton_head_stat")
+    return bool(stat) and all(_mtime_ns(p) == m for p, m in stat.items())
+
+
 def _scan_key_files(skeleton_dir: Path) -> list[dict]:
     """Scan the skeleton for key documentation and config files."""
     entries: list[dict] = []
@@ -95,15 +205,13 @@ def _scan_engine_modules(skeleton_dir: Path) -> list[dict]:
         # Extract first docstring line
         desc = ""
         try:
-            text = py_file.read_text()
-            for line in text.splitlines():
-                stripped = line.strip()
-                if stripped.startswith('"""') or stripped.startswith("'''"):
-                    # Single-line docstring
-                    content = stripped.strip("\"'").strip()
-                    if content:
-                        desc = content.split("—")[-1].strip() if "—" in content else content
-                    break
+            # The docstring sits at the top; no need to read whole modules
+            with open(py_file, "rb") as f:
+                head = f.read(_DOCSTRING_PROBE_BYTES).decode("utf-8", "replace")
+            match = _MODULE_DOCSTRING_RE.match(head)
+            if match and match.group(1):
+                content = match.group(1)
+                desc = content.split("—")[-1].strip() if "—" in content else content
         except Exception:
             pass
         modules.append({"name": py_file.name, "description": desc})
@@ -117,49 +225,147 @@ def build_system_index(skeleton_dir: Path, runtime_dir: Path) -> dict:
     Writes the index to ``.ai_runtime/system_index.json``.
     Returns the index dict.
     """
-    head = _get_submodule_head(skeleton_dir)
+    head_stat = _head_stat(skeleton_dir)
+    return _build_index(skeleton_dir, runtime_dir, _get_submodule_head(skeleton_dir), head_stat)
+
 
+def _build_index(
+    skeleton_dir: Path,
+    runtime_dir: Path,
+    head: str,
+    head_stat: dict[str, int],
+) -> dict:
+    """Scan the skeleton and write the index for an already-resolved HEAD.
+
+    head_stat must be taken before head was read, so a HEAD move in
+    between leaves a stale stat (one extra slow check) rather than a
+    stale head.
+    """
     index = {
         "generated_at": datetime.now(timezone.utc).isoformat(),
         "skeleton_head": head,
+        "skeleton_head_stat": head_stat,
         "skeleton_path": str(skeleton_dir),
         "key_files": _scan_key_files(skeleton_dir),
         "commands": _scan_commands(skeleton_dir),
         "engine_modules": _scan_engine_modules(skeleton_dir),
     }
+    _save_index(runtime_dir, index)
+    return index
 
+
+def _save_index(runtime_dir: Path, index: dict) -> None:
+    """Atomically replace system_index.json; no-op if the bytes match."""
     runtime_dir.mkdir(parents=True, exist_ok=True)
     index_path = runtime_dir / "system_index.json"
-    index_path.write_text(json.dumps(index, indent=2, ensure_ascii=False))
-
-    return index
+    if json_codec.orjson is not None:
+        payload = json_codec.dumps(index, indent=True).encode("utf-8")
+    else:
+        payload = json.dumps(index, indent=2, ensure_ascii=False).encode("utf-8")
+    try:
+        if index_path.read_bytes() == payload:
+            return
+    except OSError:
+        pass
+    tmp_path = index_path.with_suffix(".json.tmp")
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, index_path)
 
 
 def load_system_index(runtime_dir: Path) -> dict | None:
-    """Load the cached system index, or None if it doesn't exist."""
+    """Load the cached system index, or None if it doesn't exist.
+
+    Parsed indexes are memoized per file version, so repeat calls return
+    the same dict; treat it as read-only.
+    """
     index_path = runtime_dir / "system_index.json"
-    if not index_path.exists():
-        return None
     try:
-        return json.loads(index_path.read_text())
+        st = os.stat(index_path)
+        return _load_index_file(str(index_path), st.st_mtime_ns, st.st_size, st.st_ino)
     except Exception:
         return None
 
 
+@lru_cache(maxsize=4)
+def _load_index_file(path: str, mtime_ns: int, size: int, ino: int) -> dict:
+    """Parse system_index.json; the stat fields only key the cache.
+
+    _save_index swaps in a new file via os.replace, so a rewrite changes
+    the inode even where mtime granularity is coarse.
+    """
+    return json.loads(Path(path).read_bytes())
+
+
 def needs_refresh(skeleton_dir: Path, runtime_dir: Path) -> bool:
     """Check if the system index needs rebuilding (submodule HEAD changed)."""
     cached = load_system_index(runtime_dir)
     if cached is None:
         return True
+    if _head_unchanged(cached):
+        return False
     current_head = _get_submodule_head(skeleton_dir)
     return cached.get("skeleton_head") != current_head
 
 
 def ensure_system_index(skeleton_dir: Path, runtime_dir: Path) -> dict:
     """Build or refresh the system index as needed. Returns the index."""
-    if needs_refresh(skeleton_dir, runtime_dir):
-        return build_system_index(skeleton_dir, runtime_dir)
-    return load_system_index(runtime_dir) or build_system_index(skeleton_dir, runtime_dir)
+    cached = load_system_index(runtime_dir)
+    if cached is not None and _head_unchanged(cached):
+        return cached
+
+    # Resolve HEAD once: it decides freshness and is stamped into a rebuild
+    head_stat = _head_stat(skeleton_dir)
+    head = _get_submodule_head(skeleton_dir)
+    if cached is not None and cached.get("skeleton_head") == head:
+        # Same commit, paths touched (checkout, pack-refs): re-arm the stat check
+        if head_stat and cached.get("skeleton_head_stat") != head_stat:
+            cached["skeleton_head_stat"] = head_stat
+            _save_index(runtime_dir, cached)
+        return cached
+    return _build_index(skeleton_dir, runtime_dir, head, head_stat)
+
+
+_LOOKUP_SECTIONS = ("commands", "key_files", "engine_modules")
+
+
+class _Lookup:
+    """Query-side views of one index, derived once and reused across lookups."""
+
+    __slots__ = ("sources", "sizes", "commands", "descriptions")
+
+    def __init__(self, sources: tuple[list, ...]) -> None:
+        # Holding the lists keeps their ids from being reused while cached
+        self.sources = sources
+        self.sizes = tuple(len(s) for s in sources)
+        self.commands: dict[str, dict] = {}
+        for cmd in sources[0]:
+            # setdefault keeps the first match, as the old linear scan did
+            self.commands.setdefault(cmd["name"].lower(), cmd)
+            for alias in cmd.get("aliases", []):
+                self.commands.setdefault(alias.lower().strip().lstrip("/"), cmd)
+        # Per section: (lowercased description, entry), in index order
+        self.descriptions = tuple(
+            [(e.get("description", "").lower(), e) for e in section]
+            for section in sources
+        )
+
+
+_lookup_cache: _Lookup | None = None
+
+
+def _get_lookup(index: dict) -> _Lookup:
+    """Return the lookup views for index, rebuilding if its lists changed."""
+    global _lookup_cache
+    sources = tuple(index.get(key, []) for key in _LOOKUP_SECTIONS)
+    cached = _lookup_cache
+    if (
+        cached is not None
+        and all(a is b for a, b in zip(cached.sources, sources))
+        and cached.sizes == tuple(len(s) for s in sources)
+    ):
+        return cached
+    _lookup_cache = _Lookup(sources)
+    return _lookup_cache
 
 
 def lookup_command(index: dict, query: str) -> dict | None:
@@ -167,14 +373,7 @@ def lookup_command(index: dict, query: str) -> dict | None:
 
     Returns the command dict if found, None otherwise.
     """
-    query_lower = query.lower().strip().lstrip("/")
-    for cmd in index.get("commands", []):
-        if cmd["name"].lower() == query_lower:
-            return cmd
-        for alias in cmd.get("aliases", []):
-            if alias.lower().strip().lstrip("/") == query_lower:
-                return cmd
-    return None
+    return _get_lookup(index).commands.get(query.lower().strip().lstrip("/"))
 
 
 def lookup_capability(index: dict, query: str) -> str:
@@ -182,30 +381,37 @@ def lookup_capability(index: dict, query: str) -> str:
 
     Returns a deterministic answer based on indexed data.
     """
+    not_found = (
+        f"Not found in the system layer. '{query}' is not a known command or feature. "
+        "Use /help to see available capabilities, or propose this as a new feature."
+    )
     query_lower = query.lower()
+    if not query_lower.strip():
+        # An empty query is a substring of every description
+        return not_found
+
+    lookup = _get_lookup(index)
+    commands, key_files, modules = lookup.descriptions
 
     # Check commands first
-    cmd = lookup_command(index, query)
+    cmd = lookup.commands.get(query_lower.strip().lstrip("/"))
     if cmd:
         aliases = ", ".join(cmd.get("aliases", [])[:3])
         return f"Yes. Command: {cmd['name']} — {cmd['description']}. Aliases: {aliases}"
 
     # Search command descriptions
-    for cmd in index.get("commands", []):
-        if query_lower in cmd.get("description", "").lower():
+    for desc, cmd in commands:
+        if query_lower in desc:
             return f"Related command: {cmd['name']} — {cmd['description']}"
 
     # Search key files
-    for f in index.get("key_files", []):
-        if query_lower in f.get("description", "").lower():
+    for desc, f in key_files:
+        if query_lower in desc:
             return f"See: {f['path']} — {f['description']}"
 
     # Search engine modules
-    for mod in index.get("engine_modules", []):
-        if query_lower in mod.get("description", "").lower():
+    for desc, mod in modules:
+        if query_lower in desc:
             return f"Engine module: {mod['name']} — {mod['description']}"
 
-    return (
-        f"Not found in the system layer. '{query}' is not a known command or feature. "
-        "Use /help to see available capabilities, or propose this as a new feature."
-    )
+    return not_found
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import random
+import tempfile
+from pathlib import Path
+import unittest
+from unittest import mock
+
+from engine import ai_db, ai_state
+
+
+def _write_state(ai_dir: Path) -> None:
+    state_dir = ai_dir / "state"
+    state_dir.mkdir(parents=True, exist_ok=True)
+    (state_dir / "team.yaml").write_text("orchestrator:\n  role_id: orchestrator\nworkers: []\n")
+    (state_dir / "board.yaml").write_text(
+        "columns: [backlog, done]\ntasks:\n- id: T-1\n  title: First\n  status: backlog\n"
+    )
+    (state_dir / "approvals.yaml").write_text("approval_log: []\n")
+    (state_dir / "commands.yaml").write_text("commands: []\n")
+
+
+class CanonicalHashTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._td = tempfile.TemporaryDirectory()
+        self.ai_dir = Path(self._td.name) / ".ai"
+        _write_state(self.ai_dir)
+
+    def tearDown(self) -> None:
+        self._td.cleanup()
+
+    def test_hash_is_prefixed_with_its_algorithm(self) -> None:
+        digest = ai_state.compute_canonical_hash(self.ai_dir)
+        self.assertTrue(digest.startswith(ai_state.HASH_ALGO + ":"))
+        self.assertTrue(ai_state.canonical_hash_matches(self.ai_dir, digest))
+
+    def test_sha256_hash_matches_whatever_the_local_algorithm(self) -> None:
+        digest = ai_state.compute_canonical_hash(self.ai_dir, "sha256")
+        self.assertTrue(ai_state.canonical_hash_matches(self.ai_dir, digest))
+        self.assertFalse(ai_state.canonical_hash_matches(self.ai_dir, "nohash:" + digest[7:]))
+
+    def test_legacy_unprefixed_hash_matches(self) -> None:
+        state_dir = self.ai_dir / "state"
+        h = hashlib.sha256()
+        for name in ("approvals.yaml", "board.yaml", "commands.yaml", "team.yaml"):
+            h.update((state_dir / name).read_bytes())
+        self.assertTrue(ai_state.canonical_hash_matches(self.ai_dir, h.hexdigest()))
+
+    def test_edit_breaks_the_match(self) -> None:
+        digest = ai_state.compute_canonical_hash(self.ai_dir, "sha256")
+        (self.ai_dir / "state" / "board.yaml").write_text("columns: [done]\ntasks: []\n")
+        self.assertFalse(ai_state.canonical_hash_matches(self.ai_dir, digest))
+
+
+class ReconcileTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._td = tempfile.TemporaryDirectory()
+        root = Path(self._td.name)
+        self.ai_dir = root / ".ai"
+        self.runtime_dir = root / ".ai_runtime"
+        _write_state(self.ai_dir)
+        self.board = self.ai_dir / "state" / "board.yaml"
+        self.assertTrue(ai_state.reconcile(self.ai_dir, self.runtime_dir))
+
+    def tearDown(self) -> None:
+        ai_db.close_db(self.runtime_dir)
+        self._td.cleanup()
+
+    def _task_titles(self) -> list[str]:
+        conn = ai_db.connect_db(self.runtime_dir)
+        try:
+            return [r["title"] for r in conn.execute("SELECT title FROM tasks ORDER BY id")]
+        finally:
+            ai_db.release_db(conn)
+
+    def test_unchanged_state_takes_the_fast_path(self) -> None:
+        self.assertFalse(ai_state.reconcile(self.ai_dir, self.runtime_dir))
+
+    def test_edited_yaml_is_reingested(self) -> None:
+        self.board.write_text(
+            "columns: [backlog, done]\ntasks:\n- id: T-1\n  title: Renamed task\n  status: done\n"
+        )
+        self.assertTrue(ai_state.reconcile(self.ai_dir, self.runtime_dir))
+        self.assertEqual(self._task_titles(), ["Renamed task"])
+        self.assertFalse(ai_state.reconcile(self.ai_dir, self.runtime_dir))
+
+    def test_mark_dirty_catches_an_edit_the_stat_check_misses(self) -> None:
+        st = os.stat(self.board)
+        # Same size, mtime restored: invisible to the (mtime_ns, size) check
+        self.board.write_text(self.board.read_text().replace("First", "Fixed"))
+        os.utime(self.board, ns=(st.st_atime_ns, st.st_mtime_ns))
+        self.assertFalse(ai_state.reconcile(self.ai_dir, self.runtime_dir))
+
+        ai_state.mark_dirty(self.ai_dir)
+        self.assertTrue(ai_state.reconcile(self.ai_dir, self.runtime_dir))
+        self.assertEqual(self._task_titles(), ["Fixed"])
+        self.assertFalse((self.ai_dir / "state" / ai_state.DIRTY_MARKER).exists())
+
+    def test_stale_sidecar_is_ignored(self) -> None:
+        ai_state.load_canonical(self.ai_dir)
+        sidecar = self.ai_dir / "state" / ai_state.CANONICAL_SIDECAR
+        self.assertTrue(sidecar.is_file())
+
+        self.board.write_text(
+            "columns: [backlog, done]\ntasks:\n- id: T-2\n  title: Second\n  status: backlog\n"
+        )
+        # A fresh process: only the on-disk sidecar could serve the old parse
+        ai_state._hash_files.cache_clear()
+        ai_state._load_canonical_cached.cache_clear()
+        board = ai_state.load_canonical(self.ai_dir)["board"]
+        self.assertEqual([t["id"] for t in board["tasks"]], ["T-2"])
+
+        # A sidecar with a foreign hash is ignored too, and then replaced
+        sidecar.write_text(json.dumps({"hash": "sha256:00", "data": {"board": {}}}))
+        ai_state._load_canonical_cached.cache_clear()
+        board = ai_state.load_canonical(self.ai_dir)["board"]
+        self.assertEqual([t["id"] for t in board["tasks"]], ["T-2"])
+        self.assertNotEqual(json.loads(sidecar.read_text())["hash"], "sha256:00")
+
+
+@unittest.skipIf(ai_state._numpy() is None, "numpy not installed")
+class ClassifyTasksNumpyTests(unittest.TestCase):
+    def _board(self, n: int) -> list[dict]:
+        rnd = random.Random(n)
+        statuses = ["backlog", "ready", "in_progress", "review", "done", "blocked", "weird"]
+        tasks = []
+        for i in range(n):
+            task = {"id": f"T-{i}", "title": f"Task {i}"}
+            if rnd.random() < 0.9:  # the rest default to backlog
+                task["status"] = rnd.choice(statuses)
+            tasks.append(task)
+        return tasks
+
+    def test_numpy_path_matches_the_python_loop(self) -> None:
+        tasks = self._board(ai_state._NUMPY_MIN_TASKS + 57)
+        for columns in (
+            ["backlog", "ready", "in_progress", "review", "done"],
+            ["backlog", "done"],  # in_progress outside columns is still active
+        ):
+            with self.subTest(columns=columns):
+                fast = ai_state._classify_tasks(tasks, columns)
+                with mock.patch.object(ai_state, "_numpy", return_value=None):
+                    slow = ai_state._classify_tasks(tasks, columns)
+                self.assertEqual(fast, slow)
+                counts, by_status, active = fast
+                self.assertEqual(list(counts), columns)
+                self.assertTrue(active)
+                self.assertLess(sum(counts.values()), len(tasks))
+
+
+if __name__ == "__main__":
+    unittest.main()
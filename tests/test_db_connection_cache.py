@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import gc
+import sqlite3
+import tempfile
+import threading
+from pathlib import Path
+import unittest
+
+from engine import ai_db
+
+
+class ConnectionCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._td = tempfile.TemporaryDirectory()
+        self.runtime_dir = Path(self._td.name)
+        self.key = ai_db._cache_key(ai_db.get_db_path(self.runtime_dir))
+
+    def tearDown(self) -> None:
+        ai_db.close_db(self.runtime_dir)
+        self._td.cleanup()
+
+    def _live(self) -> int:
+        gc.collect()
+        return len(ai_db._OPEN_CONNS.get(self.key, ()))
+
+    def test_rollback_journal_db_is_upgraded_to_wal(self) -> None:
+        db_path = ai_db.get_db_path(self.runtime_dir)
+        legacy = sqlite3.connect(str(db_path))
+        legacy.execute("PRAGMA journal_mode=DELETE")
+        legacy.executescript(ai_db.SCHEMA_SQL)
+        legacy.close()
+
+        conn = ai_db.connect_db(self.runtime_dir)
+        self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+
+    def test_release_keeps_connection_for_next_call(self) -> None:
+        conn = ai_db.connect_db(self.runtime_dir)
+        ai_db.release_db(conn)
+        self.assertIs(ai_db.connect_db(self.runtime_dir), conn)
+
+    def test_thread_connections_die_with_their_thread(self) -> None:
+        ai_db.connect_db(self.runtime_dir)
+
+        def worker() -> None:
+            ai_db.add_event(ai_db.connect_db(self.runtime_dir), "test", "ping")
+
+        for _ in range(6):
+            t = threading.Thread(target=worker)
+            t.start()
+            t.join()
+        self.assertEqual(self._live(), 1)
+
+    def test_close_db_closes_every_thread(self) -> None:
+        main_conn = ai_db.connect_db(self.runtime_dir)
+        opened, finish = threading.Event(), threading.Event()
+        seen: dict[str, sqlite3.Connection] = {}
+
+        def holder() -> None:
+            seen["before"] = ai_db.connect_db(self.runtime_dir)
+            opened.set()
+            finish.wait()
+            seen["after"] = ai_db.connect_db(self.runtime_dir)
+
+        t = threading.Thread(target=holder)
+        t.start()
+        opened.wait()
+        ai_db.close_db(self.runtime_dir)
+        for conn in (main_conn, seen["before"]):
+            with self.assertRaises(sqlite3.ProgrammingError):
+                conn.execute("SELECT 1")
+        finish.set()
+        t.join()
+
+        # A closed cache entry is replaced on the next connect_db
+        self.assertIsNot(seen["after"], seen["before"])
+        self.assertIsNot(ai_db.connect_db(self.runtime_dir), main_conn)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import tempfile
+from contextlib import ExitStack
+from pathlib import Path
+import unittest
+from unittest import mock
+
+from engine import ai_db, ai_memory, json_codec
+
+
+def _write_state(ai_dir: Path) -> None:
+    state_dir = ai_dir / "state"
+    state_dir.mkdir(parents=True, exist_ok=True)
+    (state_dir / "team.yaml").write_text("orchestrator:\n  role_id: orchestrator\nworkers: []\n")
+    (state_dir / "board.yaml").write_text("columns: [backlog, done]\ntasks: []\n")
+    (state_dir / "approvals.yaml").write_text("approval_log: []\n")
+    (state_dir / "commands.yaml").write_text("commands: []\n")
+
+
+class PackRoundtripBase(unittest.TestCase):
+    def setUp(self) -> None:
+        self._td = tempfile.TemporaryDirectory()
+        self.root = Path(self._td.name)
+        self.ai_dir = self.root / ".ai"
+        _write_state(self.ai_dir)
+        self.runtime_dir = self.root / "rt_src"
+        conn = ai_db.connect_db(self.runtime_dir)
+        for i in range(200):
+            ai_db.add_event(conn, "user", "message", {"i": i, "text": f"event {i} é"})
+        ai_db.release_db(conn)
+        self.events = list(ai_db.iter_events(ai_db.connect_db(self.runtime_dir)))
+
+    def tearDown(self) -> None:
+        for name in ("rt_src", "rt_dst"):
+            ai_db.close_db(self.root / name)
+        self._td.cleanup()
+
+    def _manifest(self, pack: str) -> dict:
+        with ExitStack() as stack:
+            _, open_member = ai_memory._open_pack(Path(pack), stack)
+            with open_member("manifest.json") as f:
+                return json_codec.loads(f.read())
+
+    def _roundtrip(self, out_name: str, **export_kwargs) -> dict:
+        """Export to out_name, import into a fresh runtime; return the manifest."""
+        dst_runtime = self.root / "rt_dst"
+        ai_db.close_db(dst_runtime)
+        for path in dst_runtime.glob("ai.db*"):
+            path.unlink()
+
+        out = str(self.root / out_name) if out_name else None
+        pack = ai_memory.export_memory(self.ai_dir, self.runtime_dir, "test", out, **export_kwargs)
+        result = ai_memory.import_memory(self.ai_dir, dst_runtime, pack)
+        self.assertIn(f"Imported {len(self.events)} events", result)
+
+        imported = list(ai_db.iter_events(ai_db.connect_db(dst_runtime)))
+        self.assertEqual(imported[:len(self.events)], self.events)
+        return self._manifest(pack)
+
+
+@unittest.skipIf(ai_memory.zstandard is None, "zstandard not installed")
+class TarZstPackTests(PackRoundtripBase):
+    def test_roundtrip(self) -> None:
+        manifest = self._roundtrip("pack.tar.zst")
+        self.assertEqual(manifest["events_format"], "jsonl")
+
+    def test_roundtrip_with_events_spilled_to_disk(self) -> None:
+        with mock.patch.object(ai_memory, "_SPOOL_MAX_BYTES", 1024):
+            self._roundtrip("spilled.tar.zst")
+
+
+@unittest.skipIf(ai_memory.msgspec is None, "msgspec not installed")
+class MsgpackPackTests(PackRoundtripBase):
+    def test_roundtrip_in_every_container(self) -> None:
+        outs = ["pack_dir", "pack.zip"]
+        if ai_memory.zstandard is not None:
+            outs.append("pack.tar.zst")
+        for out in outs:
+            with self.subTest(out=out):
+                manifest = self._roundtrip(out, events_format="msgpack")
+                self.assertEqual(manifest["version"], "1.1")
+                self.assertEqual(manifest["events_format"], "msgpack")
+
+    def test_default_export_stays_jsonl(self) -> None:
+        manifest = self._roundtrip("pack.zip")
+        self.assertEqual(manifest["version"], "1.0")
+        self.assertEqual(manifest["events_format"], "jsonl")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+import unittest
+from unittest import mock
+
+from engine.memory_core import store_sqlite
+from engine.memory_core.api import SessionMemory
+
+
+FTS_TRIGGERS = ("messages_ai", "facts_ai")
+
+
+class PackImportFtsTests(unittest.TestCase):
+    """Pack import drops the FTS insert triggers, backfills, then restores them."""
+
+    def setUp(self) -> None:
+        self._td = tempfile.TemporaryDirectory()
+        self.root = Path(self._td.name)
+
+    def tearDown(self) -> None:
+        self._td.cleanup()
+
+    def _memory(self, name: str, fts_module: str) -> SessionMemory:
+        mem = SessionMemory(self.root / name)
+        # The FTS module is chosen when the connection is first opened
+        with mock.patch.object(
+            store_sqlite, "detect_fts5", return_value=fts_module == "fts5"
+        ):
+            mem.conn
+        self.assertEqual(mem._fts_module, fts_module)
+        self.addCleanup(mem.close)
+        return mem
+
+    def _export(self, fts_module: str) -> Path:
+        src = self._memory("src", fts_module)
+        for i in range(30):
+            src.add_message("s", "default", "user", f"imported widget note {i}")
+        src.add_fact("s", "default", "Imported widget fact")
+        pack = self.root / "pack.zip"
+        src.export_pack(pack)
+        return pack
+
+    def _fts_count(self, mem: SessionMemory, table: str, term: str) -> int:
+        return mem.conn.execute(
+            f"SELECT COUNT(*) FROM {table} WHERE {table} MATCH ?", (term,)
+        ).fetchone()[0]
+
+    def _triggers(self, mem: SessionMemory) -> set[str]:
+        rows = mem.conn.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+        return {name for (name,) in rows}
+
+    def _check_roundtrip(self, fts_module: str) -> None:
+        pack = self._export(fts_module)
+        dst = self._memory("dst", fts_module)
+        dst.add_message("s", "default", "user", "local widget before import")
+
+        counts = dst.import_pack(pack)
+        self.assertEqual(counts["messages"], 30)
+        self.assertTrue(set(FTS_TRIGGERS) <= self._triggers(dst))
+
+        # Imported rows were backfilled into the index alongside the old one
+        self.assertEqual(len(dst.search("s", "default", "widget", limit=100)), 31)
+        self.assertEqual(self._fts_count(dst, "facts_fts", "widget"), 1)
+
+        # The recreated triggers index new rows
+        dst.add_message("s", "default", "user", "gadget after import")
+        self.assertEqual(len(dst.search("s", "default", "gadget")), 1)
+
+        dst.purge(namespace="default")
+        self.assertEqual(dst.search("s", "default", "widget"), [])
+        self.assertEqual(self._fts_count(dst, "messages_fts", "widget"), 0)
+
+    def test_roundtrip_fts5(self) -> None:
+        probe = store_sqlite.connect(self.root / "probe.db")
+        try:
+            if not store_sqlite.detect_fts5(probe):
+                self.skipTest("SQLite built without FTS5")
+        finally:
+            probe.close()
+        self._check_roundtrip("fts5")
+
+    def test_roundtrip_fts4(self) -> None:
+        self._check_roundtrip("fts4")
+
+    def test_failed_import_restores_triggers(self) -> None:
+        pack_dir = self.root / "pack_dir"
+        src = self._memory("src", "fts4")
+        src.add_message("s", "default", "user", "imported widget note")
+        src.export_pack(pack_dir)
+        (pack_dir / "checksums.json").unlink()
+        with open(pack_dir / "messages.jsonl", "a") as f:
+            f.write("{not json\n")
+
+        dst = self._memory("dst", "fts4")
+        with self.assertRaises(ValueError):
+            dst.import_pack(pack_dir)
+
+        # Rollback covers the dropped triggers as well as the rows
+        self.assertTrue(set(FTS_TRIGGERS) <= self._triggers(dst))
+        self.assertEqual(dst.search("s", "default", "widget"), [])
+        dst.add_message("s", "default", "user", "gadget after failed import")
+        self.assertEqual(len(dst.search("s", "default", "gadget")), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
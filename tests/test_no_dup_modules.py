@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import re
+from pathlib import Path
+import unittest
+
+from engine import ai_run
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+ENGINE_DIR = REPO_ROOT / "engine"
+
+
+def _engine_sources() -> dict[Path, str]:
+    return {
+        path: path.read_text()
+        for path in sorted(ENGINE_DIR.rglob("*.py"))
+        if "__pycache__" not in path.parts
+    }
+
+
+class NoDuplicateModulesTests(unittest.TestCase):
+    def test_dispatcher_is_defined_once(self) -> None:
+        sources = _engine_sources()
+        for pattern in (r"^def dispatch_command\(", r"^HANDLERS\s*=", r"^def run_loop\("):
+            owners = [
+                path.relative_to(REPO_ROOT).as_posix()
+                for path, text in sources.items()
+                if re.search(pattern, text, re.MULTILINE)
+            ]
+            self.assertEqual(owners, ["engine/ai_run.py"], pattern)
+
+    def test_top_level_handlers_are_defined_once(self) -> None:
+        text = (ENGINE_DIR / "ai_run.py").read_text()
+        names = re.findall(r"^def (handle_\w+)\(", text, re.MULTILINE)
+        duplicates = sorted({n for n in names if names.count(n) > 1})
+        self.assertEqual(duplicates, [])
+
+    def test_registry_includes_migrate_and_session_memory(self) -> None:
+        for name in (
+            "handle_migrate",
+            "handle_session_memory_export",
+            "handle_session_memory_import",
+            "handle_session_memory_purge",
+        ):
+            self.assertIn(name, ai_run.HANDLERS)
+
+
+if __name__ == "__main__":
+    unittest.main()
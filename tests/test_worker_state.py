@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import shutil
+import tempfile
+from pathlib import Path
+import unittest
+
+from engine import ai_worker_state
+
+
+class WorkerDirRecreationTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._td = tempfile.TemporaryDirectory()
+        self.root = Path(self._td.name)
+        (self.root / ".ai").mkdir()
+        self.workers_dir = ai_worker_state.ensure_workers_dir(self.root)
+
+    def tearDown(self) -> None:
+        self._td.cleanup()
+
+    def test_writers_recreate_removed_workers_dir(self) -> None:
+        shutil.rmtree(self.workers_dir)
+        roster = ai_worker_state.write_roster(self.root, [{"worker_id": "w1", "role": "dev"}])
+        self.assertTrue(roster.is_file())
+
+        shutil.rmtree(self.workers_dir)
+        cp_id = ai_worker_state.write_canonical_checkpoint(self.root, "w1", {"completed": ["a"]})
+        self.assertTrue((self.workers_dir / "checkpoints" / "w1" / f"{cp_id}.md").is_file())
+
+        shutil.rmtree(self.workers_dir)
+        summary = ai_worker_state.write_summary(self.root, "w1", {"role": "dev"})
+        self.assertTrue(summary.is_file())
+
+
+if __name__ == "__main__":
+    unittest.main()